@@ -2,94 +2,189 @@
 Configuration settings for the AI/Optimization Engine
 """
 import os
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
-class Settings:
-    """Configuration settings for the optimization engine"""
-    
-    def __init__(self):
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+def _load() -> Dict[str, Any]:
+    """Read environment overrides once at import time"""
+    return {
         # API Configuration
-        self.API_HOST = os.getenv("AI_ENGINE_HOST", "0.0.0.0")
-        self.API_PORT = int(os.getenv("AI_ENGINE_PORT", "8001"))
-        self.API_WORKERS = int(os.getenv("AI_ENGINE_WORKERS", "1"))
-        
+        "API_HOST": os.getenv("AI_ENGINE_HOST", "0.0.0.0"),
+        "API_PORT": int(os.getenv("AI_ENGINE_PORT", "8001")),
+        "API_WORKERS": int(os.getenv("AI_ENGINE_WORKERS", "1")),
+
         # Optimization Algorithm Configuration
-        self.DEFAULT_ALGORITHM = os.getenv("DEFAULT_ALGORITHM", "csp")
-        
+        "DEFAULT_ALGORITHM": os.getenv("DEFAULT_ALGORITHM", "csp"),
+
         # CSP Solver Configuration
-        self.CSP_SOLVER_TIMEOUT = int(os.getenv("CSP_SOLVER_TIMEOUT", "300"))  # 5 minutes
-        self.CSP_MAX_SOLUTIONS = int(os.getenv("CSP_MAX_SOLUTIONS", "1"))
-        
+        "CSP_SOLVER_TIMEOUT": int(os.getenv("CSP_SOLVER_TIMEOUT", "300")),  # 5 minutes
+        "CSP_MAX_SOLUTIONS": int(os.getenv("CSP_MAX_SOLUTIONS", "1")),
+        "CSP_NUM_WORKERS": int(os.getenv("CSP_NUM_WORKERS", str(os.cpu_count() or 8))),
+        "CSP_PARAMS_FILE": os.getenv("CSP_PARAMS_FILE", ""),  # Tuned SatParameters (text format)
+        "CSP_PARALLEL_MIN_COMPONENTS": int(os.getenv("CSP_PARALLEL_MIN_COMPONENTS", "8")),
+        "CSP_GA_WARM_START": os.getenv("CSP_GA_WARM_START", "false").lower() == "true",
+
         # Genetic Algorithm Configuration
-        self.GA_POPULATION_SIZE = int(os.getenv("GA_POPULATION_SIZE", "100"))
-        self.GA_GENERATIONS = int(os.getenv("GA_GENERATIONS", "1000"))
-        self.GA_MUTATION_RATE = float(os.getenv("GA_MUTATION_RATE", "0.1"))
-        self.GA_CROSSOVER_RATE = float(os.getenv("GA_CROSSOVER_RATE", "0.8"))
-        self.GA_TIMEOUT = int(os.getenv("GA_TIMEOUT", "600"))  # 10 minutes
-        
+        "GA_POPULATION_SIZE": int(os.getenv("GA_POPULATION_SIZE", "100")),
+        "GA_GENERATIONS": int(os.getenv("GA_GENERATIONS", "1000")),
+        "GA_MUTATION_RATE": float(os.getenv("GA_MUTATION_RATE", "0.1")),
+        "GA_CROSSOVER_RATE": float(os.getenv("GA_CROSSOVER_RATE", "0.8")),
+        "GA_TIMEOUT": int(os.getenv("GA_TIMEOUT", "600")),  # 10 minutes
+        "GA_PARALLEL_MIN_POPULATION": int(os.getenv("GA_PARALLEL_MIN_POPULATION", "2000")),
+        "GA_EVAL_WORKERS": int(os.getenv("GA_EVAL_WORKERS", str(os.cpu_count() or 4))),
+
         # ILP Solver Configuration
-        self.ILP_SOLVER_TIMEOUT = int(os.getenv("ILP_SOLVER_TIMEOUT", "300"))  # 5 minutes
-        self.ILP_MIP_GAP = float(os.getenv("ILP_MIP_GAP", "0.01"))  # 1% optimality gap
-        
+        "ILP_SOLVER_TIMEOUT": int(os.getenv("ILP_SOLVER_TIMEOUT", "300")),  # 5 minutes
+        "ILP_MIP_GAP": float(os.getenv("ILP_MIP_GAP", "0.01")),  # 1% optimality gap
+        "ILP_SOLVER": os.getenv("ILP_SOLVER", ""),  # PuLP solver name; empty picks the fastest available
+        "ILP_THREADS": int(os.getenv("ILP_THREADS", str(os.cpu_count() or 4))),
+
+        # Seed shared by the randomized solvers so repeated runs are reproducible
+        "RANDOM_SEED": int(os.getenv("RANDOM_SEED", "42")),
+
         # Logging Configuration
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-        self.LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO"),
+
         # Performance Configuration
-        self.MAX_PARALLEL_JOBS = int(os.getenv("MAX_PARALLEL_JOBS", "4"))
-        self.RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", "3600"))  # 1 hour
-        
+        "MAX_PARALLEL_JOBS": int(os.getenv("MAX_PARALLEL_JOBS", "4")),
+        "MAX_QUEUED_JOBS": int(os.getenv("MAX_QUEUED_JOBS", "64")),
+        "RESULT_CACHE_TTL": int(os.getenv("RESULT_CACHE_TTL", "3600")),  # 1 hour
+
         # Timetable Configuration Defaults
-        self.DEFAULT_SLOT_DURATION = int(os.getenv("DEFAULT_SLOT_DURATION", "50"))  # minutes
-        self.DEFAULT_COLLEGE_START = os.getenv("DEFAULT_COLLEGE_START", "08:30")
-        self.DEFAULT_COLLEGE_END = os.getenv("DEFAULT_COLLEGE_END", "17:30")
-        self.DEFAULT_SLOTS_PER_DAY = int(os.getenv("DEFAULT_SLOTS_PER_DAY", "8"))
-        self.DEFAULT_LUNCH_DURATION = int(os.getenv("DEFAULT_LUNCH_DURATION", "60"))  # minutes
-        
+        "DEFAULT_SLOT_DURATION": int(os.getenv("DEFAULT_SLOT_DURATION", "50")),  # minutes
+        "DEFAULT_COLLEGE_START": os.getenv("DEFAULT_COLLEGE_START", "08:30"),
+        "DEFAULT_COLLEGE_END": os.getenv("DEFAULT_COLLEGE_END", "17:30"),
+        "DEFAULT_SLOTS_PER_DAY": int(os.getenv("DEFAULT_SLOTS_PER_DAY", "8")),
+        "DEFAULT_LUNCH_DURATION": int(os.getenv("DEFAULT_LUNCH_DURATION", "60")),  # minutes
+
         # Constraint Weights (for multi-objective optimization)
-        self.WEIGHT_FACULTY_CONFLICT = float(os.getenv("WEIGHT_FACULTY_CONFLICT", "100.0"))
-        self.WEIGHT_ROOM_CONFLICT = float(os.getenv("WEIGHT_ROOM_CONFLICT", "100.0"))
-        self.WEIGHT_STUDENT_CONFLICT = float(os.getenv("WEIGHT_STUDENT_CONFLICT", "90.0"))
-        self.WEIGHT_WORKLOAD_BALANCE = float(os.getenv("WEIGHT_WORKLOAD_BALANCE", "20.0"))
-        self.WEIGHT_PREFERENCE_SATISFACTION = float(os.getenv("WEIGHT_PREFERENCE_SATISFACTION", "10.0"))
-        self.WEIGHT_ROOM_UTILIZATION = float(os.getenv("WEIGHT_ROOM_UTILIZATION", "5.0"))
-        
+        "WEIGHT_FACULTY_CONFLICT": float(os.getenv("WEIGHT_FACULTY_CONFLICT", "100.0")),
+        "WEIGHT_ROOM_CONFLICT": float(os.getenv("WEIGHT_ROOM_CONFLICT", "100.0")),
+        "WEIGHT_STUDENT_CONFLICT": float(os.getenv("WEIGHT_STUDENT_CONFLICT", "90.0")),
+        "WEIGHT_WORKLOAD_BALANCE": float(os.getenv("WEIGHT_WORKLOAD_BALANCE", "20.0")),
+        "WEIGHT_PREFERENCE_SATISFACTION": float(os.getenv("WEIGHT_PREFERENCE_SATISFACTION", "10.0")),
+        "WEIGHT_ROOM_UTILIZATION": float(os.getenv("WEIGHT_ROOM_UTILIZATION", "5.0")),
+
         # Integration Configuration
-        self.MAIN_API_URL = os.getenv("MAIN_API_URL", "http://localhost:5000")
-        self.ENABLE_INTEGRATION = os.getenv("ENABLE_INTEGRATION", "true").lower() == "true"
-        
-    def get_algorithm_config(self, algorithm: str) -> Dict[str, Any]:
-        """Get configuration for specific algorithm"""
-        configs = {
-            "csp": {
+        "MAIN_API_URL": os.getenv("MAIN_API_URL", "http://localhost:5000"),
+        "ENABLE_INTEGRATION": os.getenv("ENABLE_INTEGRATION", "true").lower() == "true",
+    }
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Configuration settings for the optimization engine (resolved once at startup)"""
+
+    # API Configuration
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8001
+    API_WORKERS: int = 1
+
+    # Optimization Algorithm Configuration
+    DEFAULT_ALGORITHM: str = "csp"
+
+    # CSP Solver Configuration
+    CSP_SOLVER_TIMEOUT: int = 300
+    CSP_MAX_SOLUTIONS: int = 1
+    CSP_NUM_WORKERS: int = 8
+    CSP_PARAMS_FILE: str = ""
+    CSP_PARALLEL_MIN_COMPONENTS: int = 8  # Independent sub-problems are solved across processes from this count
+    CSP_GA_WARM_START: bool = False  # Hint CP-SAT with a genetic timetable (HybridOptimizer) on 'csp' runs
+
+    # Genetic Algorithm Configuration
+    GA_POPULATION_SIZE: int = 100
+    GA_GENERATIONS: int = 1000
+    GA_MUTATION_RATE: float = 0.1
+    GA_CROSSOVER_RATE: float = 0.8
+    GA_TIMEOUT: int = 600
+    GA_PARALLEL_MIN_POPULATION: int = 2000  # Fitness is evaluated across processes from this size
+    GA_EVAL_WORKERS: int = 4
+
+    # ILP Solver Configuration
+    ILP_SOLVER_TIMEOUT: int = 300
+    ILP_MIP_GAP: float = 0.01
+    ILP_SOLVER: str = ""
+    ILP_THREADS: int = 4
+
+    # Seed shared by the randomized solvers (CP-SAT search, genetic algorithm)
+    RANDOM_SEED: int = 42
+
+    # Logging Configuration
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+    # Performance Configuration
+    MAX_PARALLEL_JOBS: int = 4
+    MAX_QUEUED_JOBS: int = 64
+    RESULT_CACHE_TTL: int = 3600
+
+    # Timetable Configuration Defaults
+    DEFAULT_SLOT_DURATION: int = 50
+    DEFAULT_COLLEGE_START: str = "08:30"
+    DEFAULT_COLLEGE_END: str = "17:30"
+    DEFAULT_SLOTS_PER_DAY: int = 8
+    DEFAULT_LUNCH_DURATION: int = 60
+
+    # Constraint Weights (for multi-objective optimization)
+    WEIGHT_FACULTY_CONFLICT: float = 100.0
+    WEIGHT_ROOM_CONFLICT: float = 100.0
+    WEIGHT_STUDENT_CONFLICT: float = 90.0
+    WEIGHT_WORKLOAD_BALANCE: float = 20.0
+    WEIGHT_PREFERENCE_SATISFACTION: float = 10.0
+    WEIGHT_ROOM_UTILIZATION: float = 5.0
+
+    # Integration Configuration
+    MAIN_API_URL: str = "http://localhost:5000"
+    ENABLE_INTEGRATION: bool = True
+
+    # Derived lookups, built once in __post_init__
+    ALGO_CONFIGS: Mapping[str, Mapping[str, Any]] = field(init=False, repr=False)
+    CONSTRAINT_WEIGHTS: Mapping[str, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "ALGO_CONFIGS", MappingProxyType({
+            "csp": MappingProxyType({
                 "timeout": self.CSP_SOLVER_TIMEOUT,
-                "max_solutions": self.CSP_MAX_SOLUTIONS
-            },
-            "genetic": {
+                "max_solutions": self.CSP_MAX_SOLUTIONS,
+                "num_workers": self.CSP_NUM_WORKERS,
+                "params_file": self.CSP_PARAMS_FILE,
+                "parallel_min_components": self.CSP_PARALLEL_MIN_COMPONENTS,
+                "ga_warm_start": self.CSP_GA_WARM_START
+            }),
+            "genetic": MappingProxyType({
                 "population_size": self.GA_POPULATION_SIZE,
                 "generations": self.GA_GENERATIONS,
                 "mutation_rate": self.GA_MUTATION_RATE,
                 "crossover_rate": self.GA_CROSSOVER_RATE,
-                "timeout": self.GA_TIMEOUT
-            },
-            "ilp": {
+                "timeout": self.GA_TIMEOUT,
+                "parallel_min_population": self.GA_PARALLEL_MIN_POPULATION,
+                "eval_workers": self.GA_EVAL_WORKERS
+            }),
+            "ilp": MappingProxyType({
                 "timeout": self.ILP_SOLVER_TIMEOUT,
-                "mip_gap": self.ILP_MIP_GAP
-            }
-        }
-        
-        return configs.get(algorithm, {})
-    
-    def get_constraint_weights(self) -> Dict[str, float]:
-        """Get constraint weights for optimization"""
-        return {
+                "mip_gap": self.ILP_MIP_GAP,
+                "solver": self.ILP_SOLVER,
+                "threads": self.ILP_THREADS
+            })
+        }))
+        object.__setattr__(self, "CONSTRAINT_WEIGHTS", MappingProxyType({
             "faculty_conflict": self.WEIGHT_FACULTY_CONFLICT,
             "room_conflict": self.WEIGHT_ROOM_CONFLICT,
             "student_conflict": self.WEIGHT_STUDENT_CONFLICT,
             "workload_balance": self.WEIGHT_WORKLOAD_BALANCE,
             "preference_satisfaction": self.WEIGHT_PREFERENCE_SATISFACTION,
             "room_utilization": self.WEIGHT_ROOM_UTILIZATION
-        }
+        }))
+
+    def get_algorithm_config(self, algorithm: str) -> Mapping[str, Any]:
+        """Get configuration for specific algorithm"""
+        return self.ALGO_CONFIGS.get(algorithm, _EMPTY)
+
+    def get_constraint_weights(self) -> Mapping[str, float]:
+        """Get constraint weights for optimization"""
+        return self.CONSTRAINT_WEIGHTS
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = Settings(**_load())
@@ -1,18 +1,47 @@
 """
 FastAPI application for AI/Optimization Engine
 """
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List, Optional
+from fastapi.responses import ORJSONResponse, Response
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
+import functools
+import hashlib
 import json
+import orjson
+import uuid
+import uvicorn
+from cachetools import LRUCache, TTLCache, cached
+from cachetools.keys import hashkey
+from config.settings import settings
 from .optimization_engine import OptimizationEngine
-from .models import OptimizationRequest, OptimizationResult, TimetableConfig
+from .models import OptimizationRequest, OptimizationResult, TimetableConfig, JobStatus
+
+# Worker processes for CPU-bound solver runs, keeps the event loop responsive
+PROCESS_POOL = ProcessPoolExecutor(max_workers=settings.MAX_PARALLEL_JOBS)
+
+# Pending async jobs, drained by MAX_PARALLEL_JOBS workers started with the app
+job_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.MAX_QUEUED_JOBS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    workers = [asyncio.create_task(_job_worker()) for _ in range(settings.MAX_PARALLEL_JOBS)]
+    yield
+    for worker in workers:
+        worker.cancel()
+    PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+    optimization_engine.shutdown()
 
 app = FastAPI(
     title="AI Timetable Optimization Engine",
     description="AI-powered timetable generation and optimization service",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -24,35 +53,72 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(http_request: Request, exc: Exception):
+    """Report unexpected errors as 500s; HTTPExceptions raised by handlers pass through untouched"""
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "detail": {
+                "message": "Internal error",
+                "error": str(exc)
+            }
+        }
+    )
+
 # Initialize optimization engine
 optimization_engine = OptimizationEngine()
 
-# Store for async optimization results
-optimization_results: Dict[str, OptimizationResult] = {}
+# Store for async optimization results (stale jobs expire after RESULT_CACHE_TTL)
+optimization_results: TTLCache = TTLCache(maxsize=1024, ttl=settings.RESULT_CACHE_TTL)
+
+# Validation results keyed by the serialized request, so "validate then optimize"
+# and repeat UI submissions skip the constraint walk
+_validation_cache: LRUCache = LRUCache(maxsize=128)
+
+@cached(_validation_cache, key=lambda request: hashkey(request.model_dump_json()))
+def validate_cached(request: OptimizationRequest) -> Tuple[str, ...]:
+    """Validate a request, memoized on its JSON form"""
+    return tuple(optimization_engine.validate_request(request))
+
+def _static_json(payload: Any) -> Tuple[bytes, str]:
+    """Serialize a payload that never changes at runtime and derive its ETag"""
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def _static_response(http_request: Request, body: bytes, etag: str) -> Response:
+    """Serve a precomputed JSON body, short-circuiting with 304 when the client has it"""
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+_ROOT_BODY, _ROOT_ETAG = _static_json({
+    "message": "AI Timetable Optimization Engine",
+    "status": "running",
+    "available_algorithms": optimization_engine.get_available_algorithms()
+})
+
+@functools.lru_cache(maxsize=1)
+def _algorithms_payload() -> Tuple[bytes, str]:
+    """Algorithm list with details; call cache_clear() if the registered optimizers change"""
+    algorithms = optimization_engine.get_available_algorithms()
+    return _static_json({
+        "algorithms": algorithms,
+        "details": {algorithm: optimization_engine.get_algorithm_info(algorithm) for algorithm in algorithms},
+        "default": "csp"
+    })
+
+_DEFAULT_CONFIG_BODY, _DEFAULT_CONFIG_ETAG = _static_json(TimetableConfig().model_dump(mode="json"))
 
 @app.get("/")
-async def root():
+async def root(http_request: Request):
     """Health check endpoint"""
-    return {
-        "message": "AI Timetable Optimization Engine",
-        "status": "running",
-        "available_algorithms": optimization_engine.get_available_algorithms()
-    }
+    return _static_response(http_request, _ROOT_BODY, _ROOT_ETAG)
 
 @app.get("/algorithms")
-async def get_algorithms():
+async def get_algorithms(http_request: Request):
     """Get available optimization algorithms"""
-    algorithms = optimization_engine.get_available_algorithms()
-    algorithm_info = {}
-    
-    for algorithm in algorithms:
-        algorithm_info[algorithm] = optimization_engine.get_algorithm_info(algorithm)
-    
-    return {
-        "algorithms": algorithms,
-        "details": algorithm_info,
-        "default": "csp"
-    }
+    return _static_response(http_request, *_algorithms_payload())
 
 @app.post("/optimize", response_model=OptimizationResult)
 async def optimize_timetable(request: OptimizationRequest, algorithm: Optional[str] = None):
@@ -66,36 +132,26 @@ async def optimize_timetable(request: OptimizationRequest, algorithm: Optional[s
     Returns:
         OptimizationResult with generated timetable
     """
-    try:
-        # Validate request
-        violations = optimization_engine.validate_request(request)
-        if violations:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "Request validation failed",
-                    "violations": violations
-                }
-            )
-        
-        # Run optimization
-        result = optimization_engine.optimize(request, algorithm)
-        
-        return result
-        
-    except Exception as e:
+    # Validate request
+    violations = validate_cached(request)
+    if violations:
         raise HTTPException(
-            status_code=500,
+            status_code=400,
             detail={
-                "message": "Optimization failed",
-                "error": str(e)
+                "message": "Request validation failed",
+                "violations": violations
             }
         )
+    
+    # Run optimization off the event loop
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(PROCESS_POOL, _run_optimization, request, algorithm)
+    
+    return result
 
 @app.post("/optimize/async")
 async def optimize_timetable_async(
     request: OptimizationRequest, 
-    background_tasks: BackgroundTasks,
     algorithm: Optional[str] = None,
     job_id: Optional[str] = None
 ):
@@ -104,57 +160,51 @@ async def optimize_timetable_async(
     
     Args:
         request: OptimizationRequest with all input data
-        background_tasks: FastAPI background tasks
         algorithm: Optional algorithm to use
         job_id: Optional job ID for tracking
         
     Returns:
         Job information for tracking progress
     """
-    import uuid
+    if job_queue.full():
+        raise HTTPException(
+            status_code=429,
+            detail={"message": "Too many optimization jobs queued, retry later"}
+        )
     
     if job_id is None:
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
     
-    try:
-        # Validate request
-        violations = optimization_engine.validate_request(request)
-        if violations:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "Request validation failed",
-                    "violations": violations
-                }
-            )
-        
-        # Store initial result
-        optimization_results[job_id] = OptimizationResult(
-            success=False,
-            message="Optimization in progress",
-            timetable_slots=[],
-            execution_time_seconds=0.0,
-            algorithm_used=algorithm or "unknown",
-            optimization_score=0.0
-        )
-        
-        # Add background task
-        background_tasks.add_task(run_optimization_async, job_id, request, algorithm)
-        
-        return {
-            "job_id": job_id,
-            "status": "started",
-            "message": "Optimization started in background"
-        }
-        
-    except Exception as e:
+    # Validate request
+    violations = validate_cached(request)
+    if violations:
         raise HTTPException(
-            status_code=500,
+            status_code=400,
             detail={
-                "message": "Failed to start optimization",
-                "error": str(e)
+                "message": "Request validation failed",
+                "violations": violations
             }
         )
+    
+    # Store initial result
+    optimization_results[job_id] = OptimizationResult(
+        success=False,
+        message="Optimization in progress",
+        timetable_slots=[],
+        execution_time_seconds=0.0,
+        algorithm_used=algorithm or "unknown",
+        optimization_score=0.0,
+        status=JobStatus.RUNNING
+    )
+    
+    # Hand off to the worker pool
+    job_queue.put_nowait((job_id, request, algorithm))
+    
+    return {
+        "job_id": job_id,
+        "status": "started",
+        "message": "Optimization started in background"
+    }
 
 @app.get("/optimize/status/{job_id}")
 async def get_optimization_status(job_id: str):
@@ -167,21 +217,20 @@ async def get_optimization_status(job_id: str):
     Returns:
         Current status and result if completed
     """
-    if job_id not in optimization_results:
+    result = optimization_results.get(job_id)
+    if result is None:
         raise HTTPException(
             status_code=404,
             detail={"message": f"Job {job_id} not found"}
         )
     
-    result = optimization_results[job_id]
-    
-    if result.message == "Optimization in progress":
+    if result.status is JobStatus.RUNNING:
         return {
             "job_id": job_id,
             "status": "running",
             "message": "Optimization still in progress"
         }
-    elif result.success:
+    elif result.status is JobStatus.COMPLETED:
         return {
             "job_id": job_id,
             "status": "completed",
@@ -195,55 +244,50 @@ async def get_optimization_status(job_id: str):
         }
 
 @app.post("/optimize/compare")
-async def compare_algorithms(request: OptimizationRequest):
+async def compare_algorithms(request: OptimizationRequest, first_success: bool = False):
     """
     Compare optimization results across all algorithms
     
     Args:
         request: OptimizationRequest with all input data
+        first_success: Stop at the first algorithm that succeeds and cancel the others
         
     Returns:
         Comparison of results from all algorithms
     """
-    try:
-        # Validate request
-        violations = optimization_engine.validate_request(request)
-        if violations:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "Request validation failed", 
-                    "violations": violations
-                }
-            )
-        
-        # Run optimization with all algorithms
-        results = optimization_engine.optimize_with_multiple_algorithms(request)
-        best_result = optimization_engine.get_best_result(results)
-        
-        # Calculate comparison metrics
-        comparison = {
-            "results": results,
-            "best_algorithm": best_result.algorithm_used,
-            "best_score": best_result.optimization_score,
-            "summary": {
-                "successful_algorithms": [name for name, result in results.items() if result.success],
-                "failed_algorithms": [name for name, result in results.items() if not result.success],
-                "execution_times": {name: result.execution_time_seconds for name, result in results.items()},
-                "scores": {name: result.optimization_score for name, result in results.items() if result.success}
-            }
-        }
-        
-        return comparison
-        
-    except Exception as e:
+    # Validate request
+    violations = validate_cached(request)
+    if violations:
         raise HTTPException(
-            status_code=500,
+            status_code=400,
             detail={
-                "message": "Algorithm comparison failed",
-                "error": str(e)
+                "message": "Request validation failed", 
+                "violations": violations
             }
         )
+    
+    # Run all algorithms concurrently on the engine's worker pool; one failure doesn't cancel
+    # the rest. The blocking wait runs on a thread so the event loop stays responsive
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(
+        None, optimization_engine.optimize_with_multiple_algorithms, request, first_success
+    )
+    best_result = optimization_engine.get_best_result(results)
+    
+    # Calculate comparison metrics
+    comparison = {
+        "results": results,
+        "best_algorithm": best_result.algorithm_used,
+        "best_score": best_result.optimization_score,
+        "summary": {
+            "successful_algorithms": [name for name, result in results.items() if result.success],
+            "failed_algorithms": [name for name, result in results.items() if not result.success],
+            "execution_times": {name: result.execution_time_seconds for name, result in results.items()},
+            "scores": {name: result.optimization_score for name, result in results.items() if result.success}
+        }
+    }
+    
+    return comparison
 
 @app.post("/validate")
 async def validate_optimization_request(request: OptimizationRequest):
@@ -256,50 +300,57 @@ async def validate_optimization_request(request: OptimizationRequest):
     Returns:
         Validation result with any constraint violations
     """
-    try:
-        violations = optimization_engine.validate_request(request)
-        
-        return {
-            "valid": len(violations) == 0,
-            "violations": violations,
-            "request_summary": {
-                "courses": len(request.courses),
-                "faculty": len(request.faculty),
-                "rooms": len(request.rooms),
-                "students": len(request.students),
-                "objectives": request.objectives
-            }
+    violations = validate_cached(request)
+    
+    return {
+        "valid": len(violations) == 0,
+        "violations": violations,
+        "request_summary": {
+            "courses": len(request.courses),
+            "faculty": len(request.faculty),
+            "rooms": len(request.rooms),
+            "students": len(request.students),
+            "objectives": request.objectives
         }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "message": "Validation failed",
-                "error": str(e)
-            }
-        )
+    }
 
 @app.get("/config/default")
-async def get_default_config():
+async def get_default_config(http_request: Request):
     """Get default timetable configuration"""
-    return TimetableConfig()
+    return _static_response(http_request, _DEFAULT_CONFIG_BODY, _DEFAULT_CONFIG_ETAG)
+
+def _run_optimization(request: OptimizationRequest, algorithm: Optional[str]) -> OptimizationResult:
+    """Process pool entry point; resolved by name so each worker uses its own engine"""
+    return optimization_engine.optimize(request, algorithm)
 
 async def run_optimization_async(job_id: str, request: OptimizationRequest, algorithm: Optional[str]):
     """Background task for running optimization"""
     try:
-        result = optimization_engine.optimize(request, algorithm)
-        optimization_results[job_id] = result
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(PROCESS_POOL, _run_optimization, request, algorithm)
+        status = JobStatus.COMPLETED if result.success else JobStatus.FAILED
+        optimization_results[job_id] = result.model_copy(update={"status": status})
     except Exception as e:
+        # Background jobs are outside the app-level handler; record the failure so the
+        # job does not stay RUNNING and the worker pulling it stays alive
         optimization_results[job_id] = OptimizationResult(
             success=False,
             message=f"Optimization failed: {str(e)}",
             timetable_slots=[],
             execution_time_seconds=0.0,
             algorithm_used=algorithm or "unknown",
-            optimization_score=0.0
+            optimization_score=0.0,
+            status=JobStatus.FAILED
         )
 
+async def _job_worker():
+    """Pull queued async jobs and run them one at a time"""
+    while True:
+        job_id, request, algorithm = await job_queue.get()
+        try:
+            await run_optimization_async(job_id, request, algorithm)
+        finally:
+            job_queue.task_done()
+
 if __name__ == "__main__":
-    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
@@ -1,40 +1,109 @@
 """
 Data models for the AI/Optimization Engine
 """
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel
-from enum import Enum
+import functools
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Sequence, Tuple
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_serializer, field_validator
+from enum import IntEnum, StrEnum
 
-class CourseType(str, Enum):
+class CourseType(StrEnum):
     MAJOR = "major"
     MINOR = "minor" 
     SKILL_BASED = "skill_based"
     ABILITY_ENHANCEMENT = "ability_enhancement"
     VALUE_ADDED = "value_added"
 
-class SessionType(str, Enum):
+class SessionType(StrEnum):
     THEORY = "theory"
     LAB = "lab"
     INTERNSHIP = "internship"
     PROJECT = "project"
 
-class OptimizationObjective(str, Enum):
+class OptimizationObjective(StrEnum):
     MINIMIZE_CONFLICTS = "minimize_conflicts"
     BALANCE_WORKLOAD = "balance_workload"
     MAXIMIZE_ROOM_UTILIZATION = "maximize_room_utilization"
     MINIMIZE_GAPS = "minimize_gaps"
 
+# Teaching days; a packed slot index is day_position * slots_per_day + period
+DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday')
+
+@functools.lru_cache(maxsize=32)
+def _time_mapping(start_time: str, slot_minutes: int, n_slots: int) -> Tuple[Tuple[int, str, str], ...]:
+    """(period, start, end) for each period of a day; parsed once per distinct config"""
+    start = datetime.strptime(start_time, "%H:%M")
+    duration = timedelta(minutes=slot_minutes)
+    return tuple(
+        (period,
+         (start + period * duration).strftime("%H:%M"),
+         (start + (period + 1) * duration).strftime("%H:%M"))
+        for period in range(n_slots)
+    )
+
+class CourseTypeCode(IntEnum):
+    """Integer codes for CourseType, for comparisons in optimizer hot loops"""
+    MAJOR = 0
+    MINOR = 1
+    SKILL_BASED = 2
+    ABILITY_ENHANCEMENT = 3
+    VALUE_ADDED = 4
+
+class SessionTypeCode(IntEnum):
+    """Integer codes for SessionType, for comparisons in optimizer hot loops"""
+    THEORY = 0
+    LAB = 1
+    INTERNSHIP = 2
+    PROJECT = 3
+
+_COURSE_TYPE_CODES = {member: CourseTypeCode[member.name] for member in CourseType}
+_SESSION_TYPE_CODES = {member: SessionTypeCode[member.name] for member in SessionType}
+
+class JobStatus(StrEnum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 class TimetableConfig(BaseModel):
     """Base timetable configuration"""
+    model_config = ConfigDict(frozen=True)
+
     slot_duration_minutes: int = 50
     college_start_time: str = "08:30"
     college_end_time: str = "17:30" 
     slots_per_day: int = 8
-    break_slots: List[Dict[str, str]] = []
+    break_slots: Tuple[Tuple[str, str, str], ...] = ()  # (day, start, end)
     lunch_duration_minutes: int = 60
+    time_limit_seconds: Optional[float] = None  # Caps the algorithm's configured timeout
+    solver_name: Optional[str] = None  # ILP backend override (PuLP solver name)
+    solver_threads: Optional[int] = None  # ILP backend thread count override
+    feasibility_only: bool = False  # ILP stops at the first feasible timetable instead of optimizing
+
+    @field_validator("break_slots", mode="before")
+    @classmethod
+    def _break_slots_from_dicts(cls, value: Any) -> Any:
+        """Accept the older [{"day", "start", "end"}] form"""
+        # ValueError (not TypeError/KeyError) so pydantic reports a 422 instead of a 500
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("break_slots must be a list of (day, start, end) entries")
+        slots = []
+        for slot in value:
+            if isinstance(slot, dict):
+                missing = [key for key in ("day", "start", "end") if key not in slot]
+                if missing:
+                    raise ValueError(f"break slot {slot!r} is missing {', '.join(missing)}")
+                slot = (slot["day"], slot["start"], slot["end"])
+            slots.append(slot)
+        return tuple(slots)
+
+    def slot_indices(self) -> Tuple[Tuple[int, str, str], ...]:
+        """(period, start, end) for each teaching period of a day"""
+        return _time_mapping(self.college_start_time, self.slot_duration_minutes, self.slots_per_day)
 
 class CourseData(BaseModel):
     """Course information for optimization"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     code: str
     name: str
@@ -46,8 +115,26 @@ class CourseData(BaseModel):
     consecutive_slots_required: int = 1
     preferred_time_slots: List[str] = []
 
+    # Integer codes resolved once at validation; API I/O keeps the string enums
+    _course_type_code: CourseTypeCode = PrivateAttr()
+    _session_type_code: SessionTypeCode = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._course_type_code = _COURSE_TYPE_CODES[self.course_type]
+        self._session_type_code = _SESSION_TYPE_CODES[self.session_type]
+
+    @property
+    def course_type_code(self) -> CourseTypeCode:
+        return self._course_type_code
+
+    @property
+    def session_type_code(self) -> SessionTypeCode:
+        return self._session_type_code
+
 class FacultyData(BaseModel):
     """Faculty information for optimization"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     email: str
@@ -58,6 +145,8 @@ class FacultyData(BaseModel):
 
 class RoomData(BaseModel):
     """Room/Lab information for optimization"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     capacity: int
@@ -68,6 +157,8 @@ class RoomData(BaseModel):
 
 class StudentData(BaseModel):
     """Student enrollment data"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     program_id: str
     semester: int
@@ -76,6 +167,8 @@ class StudentData(BaseModel):
 
 class OptimizationRequest(BaseModel):
     """Request for timetable optimization"""
+    model_config = ConfigDict(frozen=True)
+
     config: TimetableConfig
     courses: List[CourseData]
     faculty: List[FacultyData]
@@ -86,6 +179,8 @@ class OptimizationRequest(BaseModel):
 
 class TimetableSlot(BaseModel):
     """Individual timetable slot"""
+    model_config = ConfigDict(frozen=True)
+
     day: str
     time_start: str
     time_end: str
@@ -93,9 +188,39 @@ class TimetableSlot(BaseModel):
     faculty_id: str
     room_id: str
     student_groups: List[str]
+    slot_index: Optional[int] = None  # Packed day/period index, see DAYS
+
+    @classmethod
+    def from_index(cls, slot_index: int, periods: Sequence[Tuple[int, str, str]], course_id: str,
+                   faculty_id: str, room_id: str, student_groups: List[str]) -> "TimetableSlot":
+        """Materialize a slot from its packed index and the config's slot_indices()"""
+        day, period = divmod(slot_index, len(periods))
+        _, time_start, time_end = periods[period]
+        return cls(
+            day=DAYS[day],
+            time_start=time_start,
+            time_end=time_end,
+            course_id=course_id,
+            faculty_id=faculty_id,
+            room_id=room_id,
+            student_groups=student_groups,
+            slot_index=slot_index
+        )
+
+_CONFLICT_LABELS = {"faculty_conflict": "Faculty", "room_conflict": "Room"}
+
+def describe_conflict(conflict: Dict[str, Any]) -> str:
+    """Human-readable description of a conflict, formatted only when it is displayed"""
+    if "description" in conflict or "time_key" not in conflict:
+        return conflict.get("description", "")
+    day, time_start = conflict["time_key"]
+    label = _CONFLICT_LABELS.get(conflict["type"], "Resource")
+    return f"{label} {conflict['entity_id']} assigned to multiple classes at {day}_{time_start}"
 
 class OptimizationResult(BaseModel):
     """Result of timetable optimization"""
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
     timetable_slots: List[TimetableSlot]
@@ -104,9 +229,19 @@ class OptimizationResult(BaseModel):
     execution_time_seconds: float
     algorithm_used: str
     workload_distribution: Dict[str, int] = {}
+    status: Optional[JobStatus] = None  # Only set for async jobs
+
+    @field_serializer("conflicts")
+    def _serialize_conflicts(self, conflicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            conflict if "description" in conflict else {**conflict, "description": describe_conflict(conflict)}
+            for conflict in conflicts
+        ]
 
 class ConflictData(BaseModel):
     """Conflict information"""
+    model_config = ConfigDict(frozen=True)
+
     conflict_type: str
     description: str
     affected_entities: List[str]
@@ -1,9 +1,13 @@
 """
 Base optimization interface for timetable generation
 """
+import math
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 from ..models import OptimizationRequest, OptimizationResult
+from ..utils.indexed_request import IndexedRequest, resource_checks
 
 class BaseOptimizer(ABC):
     """Abstract base class for timetable optimizers"""
@@ -11,14 +15,18 @@ class BaseOptimizer(ABC):
     def __init__(self, name: str):
         self.name = name
         self.execution_time = 0.0
+        self.indexed: Optional[IndexedRequest] = None
     
     @abstractmethod
-    def optimize(self, request: OptimizationRequest) -> OptimizationResult:
+    def optimize(self, request: OptimizationRequest, indexed: Optional[IndexedRequest] = None,
+                 deadline: float = math.inf) -> OptimizationResult:
         """
         Main optimization method
         
         Args:
             request: OptimizationRequest containing all input data
+            indexed: Prebuilt lookup indexes for the request (built on demand if omitted)
+            deadline: time.monotonic() value by which to return the best solution found so far
             
         Returns:
             OptimizationResult with generated timetable and metrics
@@ -38,6 +46,22 @@ class BaseOptimizer(ABC):
         """
         pass
     
+    def check_resources(self, request: OptimizationRequest) -> Tuple[int, int, np.ndarray]:
+        """resource_checks for the request, reusing the indexes of the run when they belong to it"""
+        if self.indexed is not None and self.indexed.request is request:
+            return self.indexed.resources
+        return resource_checks(
+            np.fromiter((c.credits for c in request.courses), dtype=np.int64, count=len(request.courses)),
+            np.fromiter((f.max_workload_hours for f in request.faculty), dtype=np.int64, count=len(request.faculty)),
+            np.fromiter((r.capacity for r in request.rooms), dtype=np.int64, count=len(request.rooms)),
+            np.fromiter((c.student_strength for c in request.courses), dtype=np.int64, count=len(request.courses))
+        )
+    
+    @staticmethod
+    def remaining_time(deadline: float) -> float:
+        """Seconds left before the deadline (inf when unbounded, never negative)"""
+        return max(0.0, deadline - time.monotonic())
+    
     def calculate_optimization_score(self, result: OptimizationResult) -> float:
         """
         Calculate overall optimization score based on multiple factors
@@ -56,11 +80,11 @@ class BaseOptimizer(ABC):
         
         # Bonus for balanced workload
         if result.workload_distribution:
-            workloads = list(result.workload_distribution.values())
-            if workloads:
-                workload_variance = sum((w - sum(workloads)/len(workloads))**2 for w in workloads) / len(workloads)
-                balance_bonus = max(0, 20 - workload_variance)
-                base_score += balance_bonus
+            workloads = np.fromiter(result.workload_distribution.values(), dtype=np.float32,
+                                    count=len(result.workload_distribution))
+            workload_variance = float(workloads.var()) if workloads.size else 0.0
+            balance_bonus = max(0, 20 - workload_variance)
+            base_score += balance_bonus
         
         return max(0, min(100, base_score))
     
@@ -72,41 +96,41 @@ class BaseOptimizer(ABC):
             timetable_slots: List of timetable slots to check
             
         Returns:
-            List of detected conflicts
+            List of detected conflicts (descriptions are formatted lazily, see describe_conflict)
         """
         conflicts = []
         
-        # Group slots by day and time for conflict detection
-        time_slots = {}
+        # Single pass: index slots by (day, time) plus faculty/room and flag repeats
+        seen_faculty = {}
+        seen_rooms = {}
         for slot in timetable_slots:
-            time_key = f"{slot.day}_{slot.time_start}"
-            if time_key not in time_slots:
-                time_slots[time_key] = []
-            time_slots[time_key].append(slot)
-        
-        # Check for faculty conflicts
-        for time_key, slots in time_slots.items():
-            faculty_slots = {}
-            for slot in slots:
-                if slot.faculty_id in faculty_slots:
-                    conflicts.append({
-                        "type": "faculty_conflict",
-                        "description": f"Faculty {slot.faculty_id} assigned to multiple classes at {time_key}",
-                        "affected_slots": [faculty_slots[slot.faculty_id].course_id, slot.course_id],
-                        "severity": "critical"
-                    })
-                faculty_slots[slot.faculty_id] = slot
+            # Packed slot index when the optimizer set one, else the (day, start) strings
+            when = slot.slot_index if slot.slot_index is not None else (slot.day, slot.time_start)
+            
+            # Check for faculty conflicts
+            faculty_key = (when, slot.faculty_id)
+            if faculty_key in seen_faculty:
+                conflicts.append({
+                    "type": "faculty_conflict",
+                    "entity_id": slot.faculty_id,
+                    "time_key": (slot.day, slot.time_start),
+                    "affected_slots": [seen_faculty[faculty_key].course_id, slot.course_id],
+                    "severity": "critical"
+                })
+            else:
+                seen_faculty[faculty_key] = slot
             
             # Check for room conflicts
-            room_slots = {}
-            for slot in slots:
-                if slot.room_id in room_slots:
-                    conflicts.append({
-                        "type": "room_conflict", 
-                        "description": f"Room {slot.room_id} assigned to multiple classes at {time_key}",
-                        "affected_slots": [room_slots[slot.room_id].course_id, slot.course_id],
-                        "severity": "critical"
-                    })
-                room_slots[slot.room_id] = slot
+            room_key = (when, slot.room_id)
+            if room_key in seen_rooms:
+                conflicts.append({
+                    "type": "room_conflict", 
+                    "entity_id": slot.room_id,
+                    "time_key": (slot.day, slot.time_start),
+                    "affected_slots": [seen_rooms[room_key].course_id, slot.course_id],
+                    "severity": "critical"
+                })
+            else:
+                seen_rooms[room_key] = slot
         
         return conflicts
\ No newline at end of file
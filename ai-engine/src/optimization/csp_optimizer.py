@@ -1,25 +1,64 @@
 """
 Constraint Satisfaction Problem (CSP) based timetable optimizer using OR-Tools
 """
+import functools
+import math
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from google.protobuf import text_format
 from ortools.sat.python import cp_model
+from scipy.sparse import csr_matrix, bmat
+from scipy.sparse.csgraph import connected_components
+from config.settings import settings
 from .base_optimizer import BaseOptimizer
-from ..models import OptimizationRequest, OptimizationResult, TimetableSlot
+from ..models import DAYS, OptimizationRequest, OptimizationResult, TimetableSlot
+from ..utils.indexed_request import IndexedRequest
+
+# Presolve defaults for timetable models; a tuned CSP_PARAMS_FILE overrides them. Search is
+# left to CP-SAT's default portfolio: the model has no faculty/room overlap constraints, so a
+# fixed min-value strategy would stack every session into the earliest slots
+SOLVER_PARAMETERS: Dict[str, Any] = {
+    "symmetry_level": 2,
+    "linearization_level": 2,
+    "cp_model_probing_level": 2,
+}
+
+@functools.lru_cache(maxsize=None)
+def load_tuned_parameters(path: str) -> str:
+    """Read a persisted text-format SatParameters file (once per process)"""
+    with open(path) as params_file:
+        return params_file.read()
+
+def _solve_component(request: OptimizationRequest, deadline: float, hint: Optional[List[TimetableSlot]],
+                     num_workers: int) -> Optional[List[TimetableSlot]]:
+    """Process pool entry point: solve one independent sub-problem"""
+    optimizer = CSPOptimizer(num_workers=num_workers, decompose=False)
+    optimizer.indexed = IndexedRequest(request)
+    return optimizer._solve(request, deadline, hint)
 
 class CSPOptimizer(BaseOptimizer):
     """CSP-based timetable optimizer using Google OR-Tools CP-SAT solver"""
     
-    def __init__(self):
+    def __init__(self, num_workers: Optional[int] = None, decompose: bool = True):
         super().__init__("CSP-OR-Tools")
         self.model = None
         self.solver = None
+        self.num_workers = num_workers  # Overrides CSP_NUM_WORKERS when set
+        self.decompose = decompose
     
-    def optimize(self, request: OptimizationRequest) -> OptimizationResult:
+    def optimize(self, request: OptimizationRequest, indexed: Optional[IndexedRequest] = None,
+                 deadline: float = math.inf, hint: Optional[List[TimetableSlot]] = None) -> OptimizationResult:
         """
         Optimize timetable using Constraint Satisfaction Problem approach
+        
+        Args:
+            hint: Timetable from another optimizer used as a CP-SAT solution hint (repaired if infeasible)
         """
         start_time = time.time()
+        self.indexed = indexed or IndexedRequest(request)
         
         # Validate constraints first
         violations = self.validate_constraints(request)
@@ -34,25 +73,14 @@ class CSPOptimizer(BaseOptimizer):
             )
         
         try:
-            # Initialize CP model
-            self.model = cp_model.CpModel()
-            self.solver = cp_model.CpSolver()
-            
-            # Create decision variables
-            variables = self._create_variables(request)
-            
-            # Add constraints
-            self._add_constraints(request, variables)
-            
-            # Add objectives
-            self._add_objectives(request, variables)
-            
-            # Solve the model
-            status = self.solver.Solve(self.model)
+            # Courses that share no candidate faculty are independent sub-problems
+            components = self._components(request) if self.decompose else []
+            if len(components) > 1:
+                timetable_slots = self._solve_components(request, components, deadline, hint)
+            else:
+                timetable_slots = self._solve(request, deadline, hint)
             
-            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-                # Extract solution
-                timetable_slots = self._extract_solution(request, variables)
+            if timetable_slots is not None:
                 conflicts = self.detect_conflicts(timetable_slots)
                 workload_dist = self._calculate_workload_distribution(request, timetable_slots)
                 
@@ -67,8 +95,9 @@ class CSPOptimizer(BaseOptimizer):
                     workload_distribution=workload_dist
                 )
                 
-                result.optimization_score = self.calculate_optimization_score(result)
-                return result
+                return result.model_copy(
+                    update={"optimization_score": self.calculate_optimization_score(result)}
+                )
             
             else:
                 return OptimizationResult(
@@ -90,115 +119,275 @@ class CSPOptimizer(BaseOptimizer):
                 optimization_score=0.0
             )
     
+    def _solve(self, request: OptimizationRequest, deadline: float,
+               hint: Optional[List[TimetableSlot]]) -> Optional[List[TimetableSlot]]:
+        """Build and solve the CP-SAT model; returns the timetable, or None if none was found"""
+        # Initialize CP model
+        self.model = cp_model.CpModel()
+        self.solver = cp_model.CpSolver()
+        
+        # Create decision variables
+        variables = self._create_variables(request)
+        
+        # Add constraints
+        self._add_constraints(request, variables)
+        self._add_symmetry_breaking(request, variables)
+        
+        # Add objectives
+        self._add_objectives(request, variables)
+        
+        # Warm start from an existing timetable
+        if hint:
+            self._add_hints(request, variables, hint)
+        
+        # Solve the model within the remaining time budget
+        self._configure_solver()
+        if deadline != math.inf:
+            self.solver.parameters.max_time_in_seconds = self.remaining_time(deadline)
+        status = self.solver.Solve(self.model)
+        
+        if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+            return self._extract_solution(request, variables)
+        return None
+    
+    def _components(self, request: OptimizationRequest) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """(course indices, faculty indices) of each connected component of the candidate graph"""
+        # Same candidates as _create_variables: qualified faculty, or everyone if nobody qualifies
+        candidates = self.indexed.qualified | ~self.indexed.qualified.any(axis=1, keepdims=True)
+        n_courses = candidates.shape[0]
+        
+        edges = csr_matrix(candidates)
+        _, labels = connected_components(bmat([[None, edges], [edges.T, None]]), directed=False)
+        course_labels, faculty_labels = labels[:n_courses], labels[n_courses:]
+        
+        # Faculty without candidate courses form course-less components and are dropped
+        return [
+            (np.flatnonzero(course_labels == label), np.flatnonzero(faculty_labels == label))
+            for label in np.unique(course_labels)
+        ]
+    
+    def _solve_components(self, request: OptimizationRequest, components: List[Tuple[np.ndarray, np.ndarray]],
+                          deadline: float, hint: Optional[List[TimetableSlot]]) -> Optional[List[TimetableSlot]]:
+        """Solve each component as its own CP-SAT model in parallel and merge the timetables"""
+        sub_requests = [
+            request.model_copy(update={
+                "courses": [request.courses[c] for c in courses],
+                "faculty": [request.faculty[f] for f in faculty]
+            })
+            for courses, faculty in components
+        ]
+        hints = repeat(None)
+        if hint:
+            # Route each hint slot to the component of its course in one pass over the hint
+            component_of = {
+                request.courses[c].id: i for i, (courses, _) in enumerate(components) for c in courses
+            }
+            hints = [[] for _ in components]
+            for slot in hint:
+                if slot.course_id in component_of:
+                    hints[component_of[slot.course_id]].append(slot)
+        
+        config = settings.get_algorithm_config("csp")
+        workers = self.num_workers or config.get("num_workers", 8)
+        
+        # A handful of components is solved in-process, each with every search worker; the
+        # optimizer usually already runs inside a pool worker, so spawning another pool only
+        # pays off for many components
+        if len(components) < config.get("parallel_min_components", math.inf):
+            # Components run one after another, so each gets a share of the time left in
+            # proportion to its course count; time a component leaves unused carries over
+            remaining_courses = len(request.courses)
+            solutions = []
+            for sub_request, sub_hint in zip(sub_requests, hints):
+                share = len(sub_request.courses) / remaining_courses
+                remaining_courses -= len(sub_request.courses)
+                sub_deadline = time.monotonic() + self.remaining_time(deadline) * share
+                solution = _solve_component(sub_request, sub_deadline, sub_hint, workers)
+                if solution is None:
+                    return None
+                solutions.append(solution)
+            return [slot for solution in solutions for slot in solution]
+        
+        # Split the configured search workers across the components
+        with ProcessPoolExecutor(max_workers=max(1, min(len(components), workers))) as pool:
+            solutions = list(pool.map(_solve_component, sub_requests, repeat(deadline), hints,
+                                      repeat(max(1, workers // len(components)))))
+        
+        if any(solution is None for solution in solutions):
+            return None
+        return [slot for solution in solutions for slot in solution]
+    
     def validate_constraints(self, request: OptimizationRequest) -> List[str]:
         """Validate input constraints"""
         violations = []
         
         # Check if we have sufficient resources
-        total_course_hours = sum(course.credits for course in request.courses)
-        total_faculty_hours = sum(faculty.max_workload_hours for faculty in request.faculty)
+        total_course_hours, total_faculty_hours, unseatable = self.check_resources(request)
         
         if total_course_hours > total_faculty_hours:
             violations.append("Insufficient faculty capacity for course load")
         
         # Check room capacity constraints
-        for course in request.courses:
-            suitable_rooms = [r for r in request.rooms if r.capacity >= course.student_strength]
-            if not suitable_rooms:
-                violations.append(f"No room with sufficient capacity for course {course.code}")
+        for c in unseatable:
+            violations.append(f"No room with sufficient capacity for course {request.courses[c].code}")
         
         return violations
     
     def _create_variables(self, request: OptimizationRequest) -> Dict[str, Any]:
-        """Create decision variables for the CSP model"""
+        """Create decision variables for the CSP model (keyed by integer course/day/faculty/room indices)"""
         variables = {}
         
-        # Time slots (simplified - assuming 5 days, 8 slots per day)
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-        time_slots = list(range(request.config.slots_per_day))
+        # Packed weekly slot ids: day * slots_per_day + slot (simplified - 5 days, 8 slots per day)
+        n_slots = len(DAYS) * request.config.slots_per_day
+        faculty_by_id, rooms_by_id = self.indexed.faculty_by_id, self.indexed.rooms_by_id
         
-        # Variables: course_slot[course_id, day, slot] = 1 if course is scheduled at this time
-        variables['course_slot'] = {}
-        for course in request.courses:
-            for day in days:
-                for slot in time_slots:
-                    var_name = f"course_{course.id}_{day}_{slot}"
-                    variables['course_slot'][(course.id, day, slot)] = self.model.NewBoolVar(var_name)
+        # Variables: slot_of[course][k] = weekly slot id of the course's k-th session, one
+        # IntVar per credit instead of a Bool per (day, slot)
+        variables['slot_of'] = {}
+        for c, course in enumerate(request.courses):
+            variables['slot_of'][c] = [
+                self.model.NewIntVar(0, n_slots - 1, f"slot_{c}_{k}") for k in range(course.credits)
+            ]
         
-        # Variables: faculty_assignment[course_id, faculty_id] = 1 if faculty is assigned to course
+        # Variables: faculty_assignment[course, faculty] = 1 if faculty is assigned to course
+        # Only qualified faculty get a variable (any faculty when nobody matches the course)
         variables['faculty_assignment'] = {}
-        for course in request.courses:
-            for faculty in request.faculty:
-                var_name = f"faculty_{course.id}_{faculty.id}"
-                variables['faculty_assignment'][(course.id, faculty.id)] = self.model.NewBoolVar(var_name)
+        for c, course in enumerate(request.courses):
+            for faculty in self.indexed.qualified_faculty[course.id] or request.faculty:
+                f = faculty_by_id[faculty.id]
+                variables['faculty_assignment'][(c, f)] = self.model.NewBoolVar(f"faculty_{c}_{f}")
         
-        # Variables: room_assignment[course_id, room_id] = 1 if room is assigned to course
+        # Variables: room_assignment[course, room] = 1 if room is assigned to course
+        # Rooms too small for the course are never created
         variables['room_assignment'] = {}
-        for course in request.courses:
-            for room in request.rooms:
-                var_name = f"room_{course.id}_{room.id}"
-                variables['room_assignment'][(course.id, room.id)] = self.model.NewBoolVar(var_name)
+        for c, course in enumerate(request.courses):
+            for room in self.indexed.suitable_rooms[course.id]:
+                r = rooms_by_id[room.id]
+                variables['room_assignment'][(c, r)] = self.model.NewBoolVar(f"room_{c}_{r}")
         
         return variables
     
+    @staticmethod
+    def _group_by(assignment: Dict[Tuple[int, int], Any], position: int) -> Dict[int, List[Tuple[int, Any]]]:
+        """Group (course, resource) -> var entries by the index at `position` of the key"""
+        groups: Dict[int, List[Tuple[int, Any]]] = {}
+        for key, var in assignment.items():
+            groups.setdefault(key[position], []).append((key[1 - position], var))
+        return groups
+    
     def _add_constraints(self, request: OptimizationRequest, variables: Dict[str, Any]):
         """Add constraints to the CSP model"""
         
-        # Each course must be scheduled for exactly its credit hours
-        for course in request.courses:
-            course_slots = []
-            for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
-                for slot in range(request.config.slots_per_day):
-                    if (course.id, day, slot) in variables['course_slot']:
-                        course_slots.append(variables['course_slot'][(course.id, day, slot)])
-            
-            if course_slots:
-                self.model.Add(sum(course_slots) == course.credits)
+        # Each course is scheduled for exactly its credit hours: its sessions take distinct
+        # slots, listed in increasing order so permutations of the same sessions are one solution
+        for slots in variables['slot_of'].values():
+            self.model.AddAllDifferent(slots)
+            for earlier, later in zip(slots, slots[1:]):
+                self.model.Add(earlier < later)
         
         # Each course must have exactly one faculty assigned
-        for course in request.courses:
-            faculty_assignments = []
-            for faculty in request.faculty:
-                if (course.id, faculty.id) in variables['faculty_assignment']:
-                    faculty_assignments.append(variables['faculty_assignment'][(course.id, faculty.id)])
-            
-            if faculty_assignments:
-                self.model.Add(sum(faculty_assignments) == 1)
+        for assignments in self._group_by(variables['faculty_assignment'], 0).values():
+            self.model.Add(sum(var for _, var in assignments) == 1)
         
         # Each course must have exactly one room assigned
-        for course in request.courses:
-            room_assignments = []
-            for room in request.rooms:
-                if (course.id, room.id) in variables['room_assignment']:
-                    room_assignments.append(variables['room_assignment'][(course.id, room.id)])
-            
-            if room_assignments:
-                self.model.Add(sum(room_assignments) == 1)
+        for assignments in self._group_by(variables['room_assignment'], 0).values():
+            self.model.Add(sum(var for _, var in assignments) == 1)
         
         # Faculty workload constraints
-        for faculty in request.faculty:
-            faculty_workload = []
-            for course in request.courses:
-                if (course.id, faculty.id) in variables['faculty_assignment']:
-                    for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
-                        for slot in range(request.config.slots_per_day):
-                            if (course.id, day, slot) in variables['course_slot']:
-                                # Link faculty assignment to course scheduling
-                                faculty_workload.append(
-                                    variables['faculty_assignment'][(course.id, faculty.id)] * 
-                                    variables['course_slot'][(course.id, day, slot)]
-                                )
+        # Each course has exactly one faculty and exactly `credits` scheduled slots, so the
+        # slots a faculty teaches are sum(credits * assignment): linear, no Bool products
+        for f, assignments in self._group_by(variables['faculty_assignment'], 1).items():
+            self.model.Add(
+                sum(request.courses[c].credits * var for c, var in assignments)
+                <= request.faculty[f].max_workload_hours
+            )
+    
+    def _add_symmetry_breaking(self, request: OptimizationRequest, variables: Dict[str, Any]):
+        """Order interchangeable faculty and rooms lexicographically by their assignment vectors"""
+        # Highest-credit courses lead the vectors so the first decisions are the most constrained
+        course_order = sorted(range(len(request.courses)),
+                              key=lambda c: (-request.courses[c].credits, request.courses[c].id))
+        
+        faculty_buckets: Dict[Any, List[int]] = {}
+        for f, faculty in enumerate(request.faculty):
+            key = (frozenset(faculty.specializations), faculty.max_workload_hours)
+            faculty_buckets.setdefault(key, []).append(f)
+        
+        room_buckets: Dict[Any, List[int]] = {}
+        for r, room in enumerate(request.rooms):
+            room_buckets.setdefault((room.capacity, room.room_type), []).append(r)
+        
+        for buckets, assignment in ((faculty_buckets, variables['faculty_assignment']),
+                                    (room_buckets, variables['room_assignment'])):
+            for members in buckets.values():
+                for first, second in zip(members, members[1:]):
+                    self._add_lex_greater_equal(
+                        [assignment[(c, first)] for c in course_order if (c, first) in assignment],
+                        [assignment[(c, second)] for c in course_order if (c, second) in assignment]
+                    )
+    
+    def _add_lex_greater_equal(self, x: List[Any], y: List[Any]):
+        """Constrain Bool vector x to be lexicographically >= Bool vector y"""
+        prefix_equal = []  # Literal that is true while x[:k] == y[:k] (none for k == 0)
+        for k, (x_k, y_k) in enumerate(zip(x, y)):
+            self.model.AddBoolOr([x_k, y_k.Not()]).OnlyEnforceIf(prefix_equal)
+            if k == min(len(x), len(y)) - 1:
+                break
             
-            if faculty_workload:
-                self.model.Add(sum(faculty_workload) <= faculty.max_workload_hours)
-        
-        # Room capacity constraints
-        for room in request.rooms:
-            for course in request.courses:
-                if (course.id, room.id) in variables['room_assignment']:
-                    # Only assign room if capacity is sufficient
-                    if room.capacity < course.student_strength:
-                        self.model.Add(variables['room_assignment'][(course.id, room.id)] == 0)
+            # equal <=> prefix_equal and x_k == y_k (given x_k >= y_k under the prefix)
+            equal = self.model.NewBoolVar(f"lex_eq_{k}")
+            self.model.AddBoolOr([x_k.Not(), y_k]).OnlyEnforceIf(equal)
+            if prefix_equal:
+                self.model.AddImplication(equal, prefix_equal[0])
+            not_prefix = [literal.Not() for literal in prefix_equal]
+            self.model.AddBoolOr(not_prefix + [x_k, equal])
+            self.model.AddBoolOr(not_prefix + [y_k.Not(), equal])
+            prefix_equal = [equal]
+    
+    def _add_hints(self, request: OptimizationRequest, variables: Dict[str, Any], hint: List[TimetableSlot]):
+        """Hint every assignment variable from a timetable so CP-SAT starts from (or repairs) it"""
+        courses_by_id, faculty_by_id, rooms_by_id = (
+            self.indexed.courses_by_id, self.indexed.faculty_by_id, self.indexed.rooms_by_id
+        )
+        # A component's sub-request only indexes its own courses and faculty; entries that
+        # reference anything else (e.g. a GA-repaired faculty from another component) are skipped
+        hint = [slot for slot in hint if slot.course_id in courses_by_id]
+        scheduled: Dict[int, set] = {}
+        for slot in hint:
+            scheduled.setdefault(courses_by_id[slot.course_id], set()).add(slot.slot_index)
+        hinted_faculty = {
+            (courses_by_id[slot.course_id], faculty_by_id[slot.faculty_id])
+            for slot in hint if slot.faculty_id in faculty_by_id
+        }
+        hinted_rooms = {
+            (courses_by_id[slot.course_id], rooms_by_id[slot.room_id])
+            for slot in hint if slot.room_id in rooms_by_id
+        }
+        
+        for c, slots in variables['slot_of'].items():
+            for var, slot_index in zip(slots, sorted(scheduled.get(c, ()))):
+                self.model.AddHint(var, slot_index)
+        for key, var in variables['faculty_assignment'].items():
+            self.model.AddHint(var, key in hinted_faculty)
+        for key, var in variables['room_assignment'].items():
+            self.model.AddHint(var, key in hinted_rooms)
+        
+        self.solver.parameters.repair_hint = True
+    
+    def _configure_solver(self):
+        """Apply CP-SAT parameters"""
+        config = settings.get_algorithm_config("csp")
+        parameters = self.solver.parameters
+        parameters.num_workers = self.num_workers or config.get("num_workers", 8)
+        parameters.random_seed = settings.RANDOM_SEED
+        for name, value in SOLVER_PARAMETERS.items():
+            setattr(parameters, name, value)
+        if config.get("params_file"):
+            tuned = load_tuned_parameters(config["params_file"])
+            if hasattr(parameters, "merge_text_format"):  # pybind parameters (newer OR-Tools)
+                parameters.merge_text_format(tuned)
+            else:
+                text_format.Merge(tuned, parameters)
     
     def _add_objectives(self, request: OptimizationRequest, variables: Dict[str, Any]):
         """Add optimization objectives"""
@@ -206,73 +395,50 @@ class CSPOptimizer(BaseOptimizer):
         # Future: Add weighted objectives for workload balance, gap minimization, etc.
         pass
     
+    @staticmethod
+    def _variable_indices(variables: List[Any]) -> np.ndarray:
+        """Positions of model variables in the solver response's solution vector"""
+        return np.fromiter((var.Index() for var in variables), dtype=np.int64, count=len(variables))
+    
     def _extract_solution(self, request: OptimizationRequest, variables: Dict[str, Any]) -> List[TimetableSlot]:
         """Extract timetable solution from solved model"""
-        timetable_slots = []
+        # Read every value from the response's solution vector in bulk instead of one
+        # solver.Value() round-trip per variable
+        solution = np.asarray(self.solver.ResponseProto().solution, dtype=np.int64)
         
-        # Generate time mappings
-        time_mapping = self._generate_time_mapping(request.config)
-        
-        for course in request.courses:
-            # Find assigned faculty
-            assigned_faculty = None
-            for faculty in request.faculty:
-                if (course.id, faculty.id) in variables['faculty_assignment']:
-                    if self.solver.Value(variables['faculty_assignment'][(course.id, faculty.id)]):
-                        assigned_faculty = faculty.id
-                        break
-            
-            # Find assigned room
-            assigned_room = None
-            for room in request.rooms:
-                if (course.id, room.id) in variables['room_assignment']:
-                    if self.solver.Value(variables['room_assignment'][(course.id, room.id)]):
-                        assigned_room = room.id
-                        break
-            
-            # Find scheduled time slots
-            for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
-                for slot in range(request.config.slots_per_day):
-                    if (course.id, day, slot) in variables['course_slot']:
-                        if self.solver.Value(variables['course_slot'][(course.id, day, slot)]):
-                            time_info = time_mapping[slot]
-                            timetable_slots.append(TimetableSlot(
-                                day=day,
-                                time_start=time_info['start'],
-                                time_end=time_info['end'],
-                                course_id=course.id,
-                                faculty_id=assigned_faculty or "",
-                                room_id=assigned_room or "",
-                                student_groups=[course.id]  # Simplified
-                            ))
+        # Assigned faculty/room per course index (ids are only materialized here)
+        faculty = variables['faculty_assignment']
+        chosen = solution[self._variable_indices(list(faculty.values()))]
+        assigned_faculty = {c: request.faculty[f].id for (c, f), value in zip(faculty, chosen.tolist()) if value}
         
-        return timetable_slots
-    
-    def _generate_time_mapping(self, config) -> Dict[int, Dict[str, str]]:
-        """Generate mapping from slot numbers to actual times"""
-        from datetime import datetime, timedelta
-        
-        start_time = datetime.strptime(config.college_start_time, "%H:%M")
-        slot_duration = timedelta(minutes=config.slot_duration_minutes)
+        rooms = variables['room_assignment']
+        chosen = solution[self._variable_indices(list(rooms.values()))]
+        assigned_room = {c: request.rooms[r].id for (c, r), value in zip(rooms, chosen.tolist()) if value}
         
-        time_mapping = {}
-        current_time = start_time
+        # Period start/end times for the configured day
+        periods = request.config.slot_indices()
         
-        for slot in range(config.slots_per_day):
-            time_mapping[slot] = {
-                'start': current_time.strftime("%H:%M"),
-                'end': (current_time + slot_duration).strftime("%H:%M")
-            }
-            current_time += slot_duration
+        timetable_slots = []
+        for c, slots in variables['slot_of'].items():
+            course_id = request.courses[c].id
+            for slot_index in solution[self._variable_indices(slots)].tolist():
+                timetable_slots.append(TimetableSlot.from_index(
+                    slot_index,
+                    periods,
+                    course_id=course_id,
+                    faculty_id=assigned_faculty.get(c, ""),
+                    room_id=assigned_room.get(c, ""),
+                    student_groups=[course_id]  # Simplified
+                ))
         
-        return time_mapping
+        return timetable_slots
     
     def _calculate_workload_distribution(self, request: OptimizationRequest, timetable_slots: List[TimetableSlot]) -> Dict[str, int]:
         """Calculate workload distribution across faculty"""
-        workload = {}
-        
-        for slot in timetable_slots:
-            if slot.faculty_id:
-                workload[slot.faculty_id] = workload.get(slot.faculty_id, 0) + 1
+        # Faculty index column of the slots, counted in one pass
+        faculty_by_id = self.indexed.faculty_by_id
+        faculty = np.fromiter((faculty_by_id[slot.faculty_id] for slot in timetable_slots if slot.faculty_id),
+                              dtype=np.intp)
+        workloads = np.bincount(faculty, minlength=len(request.faculty))
         
-        return workload
\ No newline at end of file
+        return {request.faculty[f].id: int(workloads[f]) for f in np.flatnonzero(workloads)}
\ No newline at end of file
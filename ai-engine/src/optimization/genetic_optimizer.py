@@ -1,21 +1,95 @@
 """
 Genetic Algorithm based timetable optimizer for multi-objective optimization
 """
+import math
 import random
 import time
-from typing import List, Dict, Any, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from config.settings import settings
 from .base_optimizer import BaseOptimizer
-from ..models import OptimizationRequest, OptimizationResult, TimetableSlot
+from ..models import DAYS, OptimizationRequest, OptimizationResult, TimetableSlot
+from ..utils.indexed_request import IndexedRequest, qualification_matrix
 
-class Individual:
-    """Represents an individual solution in the genetic algorithm"""
+# Column layout of an individual: one int32 row per scheduled slot. A population is
+# stacked as a (population_size, n_slots, 5) array; every individual has sum(credits) rows.
+DAY, PERIOD, COURSE, FACULTY, ROOM = range(5)
+
+# Fittest individuals carried unchanged into the next generation
+ELITE_SIZE = 5
+
+# Stop once the best fitness has not improved over this many generations
+PLATEAU_GENERATIONS = 50
+PLATEAU_TOLERANCE = 1e-3
+
+# Faculty repair costs: an unqualified or overloaded assignment outweighs any load difference
+UNQUALIFIED_COST = 10.0
+OVERLOAD_COST = 10.0
+PREFERRED_BONUS = 0.5
+REPAIR_NOISE = 0.1
+
+def booking_counts(times: np.ndarray, resource: np.ndarray, n_times: int, n_resources: int) -> np.ndarray:
+    """(individual, time, resource) booking counts for a whole population in one bincount"""
+    n_individuals = times.shape[0]
+    individual = np.arange(n_individuals)[:, np.newaxis]
+    keys = (individual * n_times + times) * n_resources + resource
     
-    def __init__(self, timetable_slots: List[TimetableSlot]):
-        self.timetable_slots = timetable_slots
-        self.fitness = 0.0
-        self.conflicts = []
-        self.workload_balance = 0.0
-        self.room_utilization = 0.0
+    return np.bincount(keys.ravel(), minlength=n_individuals * n_times * n_resources).reshape(
+        n_individuals, n_times, n_resources)
+
+def workload_balance(workloads: np.ndarray) -> np.ndarray:
+    """Per-row balance score (0-1) of faculty workloads, ignoring faculty with no slots"""
+    teaching = workloads > 0
+    n_teaching = teaching.sum(axis=1)
+    mean = workloads.sum(axis=1) / np.maximum(n_teaching, 1)
+    variance = (((workloads - mean[:, np.newaxis]) ** 2) * teaching).sum(axis=1) / np.maximum(n_teaching, 1)
+    
+    # Normalize variance to 0-1 scale (lower variance = higher balance)
+    balance = 1.0 - variance / np.maximum(mean ** 2, 1e-12)
+    balance = np.where(n_teaching <= 1, 1.0, balance)
+    
+    return np.clip(np.where(n_teaching == 0, 0.0, balance), 0.0, 1.0)
+
+def evaluate_population(population: np.ndarray, slots_per_day: int, n_faculty: int, n_rooms: int,
+                        preference_bonus: float) -> np.ndarray:
+    """Vectorized multi-objective fitness of every individual in a (population, n_slots, 5) array"""
+    n_individuals, n_slots = population.shape[:2]
+    n_times = len(DAYS) * slots_per_day
+    
+    # One sweep per resource column: the faculty booking grid yields both the faculty
+    # double bookings and the per-faculty workloads (its sum over time)
+    times = population[:, :, DAY] * slots_per_day + population[:, :, PERIOD]
+    faculty_bookings = booking_counts(times, population[:, :, FACULTY], n_times, n_faculty)
+    room_bookings = booking_counts(times, population[:, :, ROOM], n_times, n_rooms)
+    
+    conflicts = (np.maximum(faculty_bookings - 1, 0).sum(axis=(1, 2)) +
+                 np.maximum(room_bookings - 1, 0).sum(axis=(1, 2)))
+    workloads = faculty_bookings.sum(axis=1)
+    
+    room_utilization = min(1.0, n_slots / (n_rooms * n_times)) if n_slots and n_rooms else 0.0
+    
+    fitness = (100.0
+               - conflicts * 10                        # Conflict penalty (high weight)
+               + workload_balance(workloads) * 20      # Workload balance bonus (medium weight)
+               + room_utilization * 10                 # Room utilization bonus (low weight)
+               + preference_bonus * 5)                 # Preference satisfaction bonus
+    
+    return np.maximum(fitness, 0.0)
+
+# Static evaluation arguments of the current run, set once per worker process
+_worker_args: Tuple[int, int, int, float] = (0, 0, 0, 0.0)
+
+def _init_evaluation_worker(slots_per_day: int, n_faculty: int, n_rooms: int, preference_bonus: float):
+    """Process pool initializer: keep the request-level scalars so chunks ship only the population"""
+    global _worker_args
+    _worker_args = (slots_per_day, n_faculty, n_rooms, preference_bonus)
+
+def _evaluate_chunk(population: np.ndarray) -> np.ndarray:
+    """Process pool entry point: fitness of one slice of the population"""
+    return evaluate_population(population, *_worker_args)
 
 class GeneticOptimizer(BaseOptimizer):
     """Genetic Algorithm optimizer for multi-objective timetable optimization"""
@@ -27,13 +101,19 @@ class GeneticOptimizer(BaseOptimizer):
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
-        self.best_individual = None
+        self.best_individual: Optional[np.ndarray] = None
+        self.best_fitness = -math.inf
+        self.random = random.Random(settings.RANDOM_SEED)
+        self.rng = np.random.default_rng(settings.RANDOM_SEED)
+        self._evaluation_pool: Optional[ProcessPoolExecutor] = None
     
-    def optimize(self, request: OptimizationRequest) -> OptimizationResult:
+    def optimize(self, request: OptimizationRequest, indexed: Optional[IndexedRequest] = None,
+                 deadline: float = math.inf) -> OptimizationResult:
         """
         Optimize timetable using Genetic Algorithm approach
         """
         start_time = time.time()
+        self.indexed = indexed or IndexedRequest(request)
         
         # Validate constraints
         violations = self.validate_constraints(request)
@@ -48,42 +128,70 @@ class GeneticOptimizer(BaseOptimizer):
             )
         
         try:
-            # Initialize population
+            self.best_individual = None
+            self.best_fitness = -math.inf
+            
+            # Reseed per run so the same request evolves the same way
+            self.random = random.Random(settings.RANDOM_SEED)
+            self.rng = np.random.default_rng(settings.RANDOM_SEED)
+            
+            # Per-course candidate faculty/room indices (qualified faculty, rooms that fit),
+            # as lists for initialization and padded tables for vectorized mutation
+            self._qualified = [
+                np.flatnonzero(qualified).tolist() or list(range(len(request.faculty)))
+                for qualified in self.indexed.qualified
+            ]
+            self._suitable_rooms = [
+                [self.indexed.rooms_by_id[r.id] for r in self.indexed.suitable_rooms[course.id] or request.rooms]
+                for course in request.courses
+            ]
+            self._assignment_cost = self._faculty_assignment_cost(request)
+            self._room_choices, self._room_choice_counts = self._choice_table(self._suitable_rooms)
+            
+            # Large populations are evaluated across worker processes
+            self._evaluation_pool = self._create_evaluation_pool(request)
+            
+            # Initialize population; offspring are bred into a second buffer and the two swap roles
             population = self._initialize_population(request)
+            offspring = np.empty_like(population)
+            best_history = deque(maxlen=PLATEAU_GENERATIONS)
             
             # Evolution process
             for generation in range(self.generations):
                 # Evaluate fitness
-                self._evaluate_population(population, request)
-                
-                # Select best individuals
-                population = self._selection(population)
-                
-                # Apply crossover and mutation
-                population = self._crossover_and_mutation(population, request)
+                fitness = self._evaluate_population(population, request)
                 
                 # Track best solution
-                best_individual = max(population, key=lambda x: x.fitness)
-                if self.best_individual is None or best_individual.fitness > self.best_individual.fitness:
-                    self.best_individual = best_individual
+                best = int(fitness.argmax())
+                if fitness[best] > self.best_fitness:
+                    self.best_individual = population[best].copy()
+                    self.best_fitness = float(fitness[best])
                 
-                # Early termination if perfect solution found
-                if best_individual.fitness >= 100.0:
+                # Early termination if perfect solution found, fitness has plateaued or out of time
+                best_history.append(self.best_fitness)
+                plateaued = (len(best_history) == best_history.maxlen and
+                             max(best_history) - min(best_history) < PLATEAU_TOLERANCE)
+                if fitness[best] >= 100.0 or plateaued or time.monotonic() > deadline:
                     break
+                
+                # Select, cross over and mutate into the offspring buffer
+                self._next_generation(population, fitness, offspring, request)
+                population, offspring = offspring, population
             
             # Extract best solution
-            if self.best_individual:
-                conflicts = self.detect_conflicts(self.best_individual.timetable_slots)
-                workload_dist = self._calculate_workload_distribution(request, self.best_individual.timetable_slots)
+            if self.best_individual is not None:
+                timetable_slots = self._to_timetable_slots(request, self.best_individual)
+                conflicts = self.detect_conflicts(timetable_slots)
+                workload_dist = self._calculate_workload_distribution(request, self.best_individual)
                 
                 result = OptimizationResult(
                     success=True,
                     message=f"Optimization completed after {generation + 1} generations",
-                    timetable_slots=self.best_individual.timetable_slots,
+                    timetable_slots=timetable_slots,
                     conflicts=conflicts,
                     execution_time_seconds=time.time() - start_time,
                     algorithm_used=self.name,
-                    optimization_score=self.best_individual.fitness,
+                    optimization_score=self.best_fitness,
                     workload_distribution=workload_dist
                 )
                 return result
@@ -106,6 +214,11 @@ class GeneticOptimizer(BaseOptimizer):
                 algorithm_used=self.name,
                 optimization_score=0.0
             )
+        
+        finally:
+            if self._evaluation_pool is not None:
+                self._evaluation_pool.shutdown(cancel_futures=True)
+                self._evaluation_pool = None
     
     def validate_constraints(self, request: OptimizationRequest) -> List[str]:
         """Validate input constraints"""
@@ -120,48 +233,28 @@ class GeneticOptimizer(BaseOptimizer):
             violations.append("No rooms provided")
         
         # Check faculty qualifications
-        for course in request.courses:
-            qualified_faculty = [f for f in request.faculty if any(spec in course.name.lower() for spec in f.specializations)]
-            if not qualified_faculty:
-                violations.append(f"No qualified faculty for course {course.code}")
+        qualified = qualification_matrix(request.courses, request.faculty)
+        for c in np.flatnonzero(~qualified.any(axis=1)):
+            violations.append(f"No qualified faculty for course {request.courses[c].code}")
         
         return violations
     
-    def _initialize_population(self, request: OptimizationRequest) -> List[Individual]:
+    def _initialize_population(self, request: OptimizationRequest) -> np.ndarray:
         """Initialize population with random solutions"""
-        population = []
-        
-        for _ in range(self.population_size):
-            individual = self._create_random_individual(request)
-            population.append(individual)
-        
-        return population
+        return np.stack([self._create_random_individual(request) for _ in range(self.population_size)])
     
-    def _create_random_individual(self, request: OptimizationRequest) -> Individual:
+    def _create_random_individual(self, request: OptimizationRequest) -> np.ndarray:
         """Create a random individual solution"""
         timetable_slots = []
         
         # Available time slots
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+        days = list(range(len(DAYS)))
         time_slots = list(range(request.config.slots_per_day))
         
-        # Generate time mapping
-        time_mapping = self._generate_time_mapping(request.config)
-        
-        for course in request.courses:
-            # Randomly assign faculty (prefer qualified ones)
-            qualified_faculty = [f for f in request.faculty if any(spec in course.name.lower() for spec in f.specializations)]
-            if not qualified_faculty:
-                qualified_faculty = request.faculty
-            
-            assigned_faculty = random.choice(qualified_faculty)
-            
-            # Randomly assign room (prefer suitable capacity)
-            suitable_rooms = [r for r in request.rooms if r.capacity >= course.student_strength]
-            if not suitable_rooms:
-                suitable_rooms = request.rooms
-            
-            assigned_room = random.choice(suitable_rooms)
+        for course_index, course in enumerate(request.courses):
+            # Randomly assign a qualified faculty and a room with suitable capacity
+            faculty_index = self.random.choice(self._qualified[course_index])
+            room_index = self.random.choice(self._suitable_rooms[course_index])
             
             # Randomly assign time slots for required credits
             slots_needed = course.credits
@@ -170,204 +263,187 @@ class GeneticOptimizer(BaseOptimizer):
             # Try to assign consecutive slots for labs
             if course.requires_lab and course.consecutive_slots_required > 1:
                 # Find consecutive slots
-                for day in random.sample(days, len(days)):
+                for day in self.random.sample(days, len(days)):
                     for start_slot in range(len(time_slots) - course.consecutive_slots_required + 1):
                         consecutive_slots = list(range(start_slot, start_slot + course.consecutive_slots_required))
                         if len(assigned_slots) + len(consecutive_slots) <= slots_needed:
                             for slot in consecutive_slots:
-                                time_info = time_mapping[slot]
-                                assigned_slots.append(TimetableSlot(
-                                    day=day,
-                                    time_start=time_info['start'],
-                                    time_end=time_info['end'],
-                                    course_id=course.id,
-                                    faculty_id=assigned_faculty.id,
-                                    room_id=assigned_room.id,
-                                    student_groups=[course.id]
-                                ))
+                                assigned_slots.append((day, slot, course_index, faculty_index, room_index))
                             break
                     if len(assigned_slots) >= slots_needed:
                         break
             
             # Fill remaining slots randomly
             while len(assigned_slots) < slots_needed:
-                day = random.choice(days)
-                slot = random.choice(time_slots)
-                time_info = time_mapping[slot]
-                
-                assigned_slots.append(TimetableSlot(
-                    day=day,
-                    time_start=time_info['start'],
-                    time_end=time_info['end'],
-                    course_id=course.id,
-                    faculty_id=assigned_faculty.id,
-                    room_id=assigned_room.id,
-                    student_groups=[course.id]
-                ))
+                day = self.random.choice(days)
+                slot = self.random.choice(time_slots)
+                assigned_slots.append((day, slot, course_index, faculty_index, room_index))
             
             timetable_slots.extend(assigned_slots[:slots_needed])
         
-        return Individual(timetable_slots)
+        return np.array(timetable_slots, dtype=np.int32).reshape(-1, 5)
     
-    def _evaluate_population(self, population: List[Individual], request: OptimizationRequest):
-        """Evaluate fitness for all individuals in population"""
-        for individual in population:
-            individual.conflicts = self.detect_conflicts(individual.timetable_slots)
-            individual.workload_balance = self._calculate_workload_balance(request, individual.timetable_slots)
-            individual.room_utilization = self._calculate_room_utilization(request, individual.timetable_slots)
-            individual.fitness = self._calculate_fitness(individual, request)
+    @staticmethod
+    def _choice_table(choices: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Pad ragged per-course candidate lists into a (n_courses, max_len) table plus lengths"""
+        counts = np.fromiter((len(c) for c in choices), dtype=np.int32, count=len(choices))
+        table = np.zeros((len(choices), max(counts, default=0)), dtype=np.int32)
+        for course, candidates in enumerate(choices):
+            table[course, :len(candidates)] = candidates
+        
+        return table, counts
     
-    def _calculate_fitness(self, individual: Individual, request: OptimizationRequest) -> float:
-        """Calculate multi-objective fitness score"""
-        fitness = 100.0
-        
-        # Conflict penalty (high weight)
-        conflict_penalty = len(individual.conflicts) * 10
-        fitness -= conflict_penalty
-        
-        # Workload balance bonus (medium weight)
-        fitness += individual.workload_balance * 20
-        
-        # Room utilization bonus (low weight)
-        fitness += individual.room_utilization * 10
-        
-        # Preference satisfaction bonus
-        preference_bonus = self._calculate_preference_satisfaction(individual, request)
-        fitness += preference_bonus * 5
-        
-        return max(0, fitness)
+    def _faculty_assignment_cost(self, request: OptimizationRequest) -> np.ndarray:
+        """Static (course, faculty) cost: unqualified penalty minus preferred-course bonus"""
+        # Courses nobody is qualified for treat every faculty as qualified
+        qualified = self.indexed.qualified | ~self.indexed.qualified.any(axis=1, keepdims=True)
+        cost = np.where(qualified, 0.0, UNQUALIFIED_COST)
+        for faculty_index, faculty in enumerate(request.faculty):
+            for course_id in faculty.preferred_courses:
+                if course_id in self.indexed.courses_by_id:
+                    cost[self.indexed.courses_by_id[course_id], faculty_index] -= PREFERRED_BONUS
+        
+        return cost
     
-    def _calculate_workload_balance(self, request: OptimizationRequest, timetable_slots: List[TimetableSlot]) -> float:
-        """Calculate workload balance score (0-1, higher is better)"""
-        workload_dist = self._calculate_workload_distribution(request, timetable_slots)
-        
-        if not workload_dist:
-            return 0.0
-        
-        workloads = list(workload_dist.values())
-        if len(workloads) <= 1:
-            return 1.0
-        
-        mean_workload = sum(workloads) / len(workloads)
-        variance = sum((w - mean_workload) ** 2 for w in workloads) / len(workloads)
-        
-        # Normalize variance to 0-1 scale (lower variance = higher balance)
-        max_variance = mean_workload ** 2  # Maximum possible variance
-        balance_score = 1.0 - (variance / max_variance) if max_variance > 0 else 1.0
-        
-        return max(0, min(1, balance_score))
+    def _to_timetable_slots(self, request: OptimizationRequest, individual: np.ndarray) -> List[TimetableSlot]:
+        """Decode an individual's rows into TimetableSlot objects"""
+        periods = request.config.slot_indices()
+        slots_per_day = request.config.slots_per_day
+        
+        return [
+            TimetableSlot.from_index(
+                day * slots_per_day + period,
+                periods,
+                course_id=request.courses[course].id,
+                faculty_id=request.faculty[faculty].id,
+                room_id=request.rooms[room].id,
+                student_groups=[request.courses[course].id]
+            )
+            for day, period, course, faculty, room in individual.tolist()
+        ]
     
-    def _calculate_room_utilization(self, request: OptimizationRequest, timetable_slots: List[TimetableSlot]) -> float:
-        """Calculate room utilization score (0-1, higher is better)"""
-        if not request.rooms or not timetable_slots:
-            return 0.0
-        
-        total_room_slots = len(request.rooms) * request.config.slots_per_day * 5  # 5 days
-        used_room_slots = len(timetable_slots)
-        
-        return min(1.0, used_room_slots / total_room_slots)
+    def _create_evaluation_pool(self, request: OptimizationRequest) -> Optional[ProcessPoolExecutor]:
+        """Worker pool for fitness evaluation, or None when the population is too small to benefit"""
+        config = settings.get_algorithm_config("genetic")
+        workers = config.get("eval_workers", 1)
+        if workers < 2 or self.population_size < config.get("parallel_min_population", math.inf):
+            return None
+        
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_evaluation_worker,
+            initargs=(request.config.slots_per_day, len(request.faculty), len(request.rooms),
+                      self._calculate_preference_satisfaction(request))
+        )
+    
+    def _evaluate_population(self, population: np.ndarray, request: OptimizationRequest) -> np.ndarray:
+        """Evaluate fitness for all individuals in population"""
+        if self._evaluation_pool is not None:
+            chunks = np.array_split(population, settings.get_algorithm_config("genetic")["eval_workers"])
+            return np.concatenate(list(self._evaluation_pool.map(_evaluate_chunk, chunks)))
+        
+        return evaluate_population(
+            population,
+            request.config.slots_per_day,
+            len(request.faculty),
+            len(request.rooms),
+            self._calculate_preference_satisfaction(request)
+        )
     
-    def _calculate_preference_satisfaction(self, individual: Individual, request: OptimizationRequest) -> float:
+    def _calculate_preference_satisfaction(self, request: OptimizationRequest) -> float:
         """Calculate preference satisfaction score (0-1, higher is better)"""
         # Simplified preference calculation
         # Future: Add time slot preferences, faculty course preferences, etc.
         return 0.5  # Placeholder
     
-    def _selection(self, population: List[Individual]) -> List[Individual]:
-        """Tournament selection"""
-        selected = []
-        tournament_size = 5
+    def _next_generation(self, population: np.ndarray, fitness: np.ndarray, offspring: np.ndarray,
+                         request: OptimizationRequest):
+        """Fill the preallocated offspring buffer from the current population"""
+        elite = np.argpartition(fitness, -min(ELITE_SIZE, len(fitness)))[-ELITE_SIZE:]
         
-        for _ in range(self.population_size):
-            tournament = random.sample(population, min(tournament_size, len(population)))
-            winner = max(tournament, key=lambda x: x.fitness)
-            selected.append(winner)
+        np.take(population, self._selection(population, fitness), axis=0, out=offspring)
+        self._crossover(offspring, request)
+        self._mutate(offspring, request)
         
-        return selected
+        # Elitism: the best of this generation survive unchanged
+        offspring[:len(elite)] = population[elite]
     
-    def _crossover_and_mutation(self, population: List[Individual], request: OptimizationRequest) -> List[Individual]:
-        """Apply crossover and mutation operations"""
-        new_population = []
+    def _selection(self, population: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+        """Tournament selection; returns the indices of the winners"""
+        tournament_size = min(5, len(population))
         
-        for i in range(0, len(population), 2):
-            parent1 = population[i]
-            parent2 = population[i + 1] if i + 1 < len(population) else population[0]
-            
-            if random.random() < self.crossover_rate:
-                child1, child2 = self._crossover(parent1, parent2, request)
-            else:
-                child1, child2 = parent1, parent2
-            
-            if random.random() < self.mutation_rate:
-                child1 = self._mutate(child1, request)
-            if random.random() < self.mutation_rate:
-                child2 = self._mutate(child2, request)
-            
-            new_population.extend([child1, child2])
+        # All tournaments of the generation drawn at once; each row's fittest contender wins
+        contenders = self.rng.integers(0, len(population), size=(len(population), tournament_size))
         
-        return new_population[:self.population_size]
+        return contenders[np.arange(len(population)), fitness[contenders].argmax(axis=1)]
     
-    def _crossover(self, parent1: Individual, parent2: Individual, request: OptimizationRequest) -> Tuple[Individual, Individual]:
-        """Single-point crossover"""
-        # Simple crossover: split timetables at random point
-        crossover_point = random.randint(1, min(len(parent1.timetable_slots), len(parent2.timetable_slots)) - 1)
-        
-        child1_slots = parent1.timetable_slots[:crossover_point] + parent2.timetable_slots[crossover_point:]
-        child2_slots = parent2.timetable_slots[:crossover_point] + parent1.timetable_slots[crossover_point:]
-        
-        return Individual(child1_slots), Individual(child2_slots)
+    def _crossover(self, population: np.ndarray, request: OptimizationRequest):
+        """Uniform per-course crossover of neighbouring pairs, in place"""
+        n_pairs = len(population) // 2
+        if not n_pairs or not population.shape[1]:
+            return
+        
+        # Rows always belong to the same course (creation order), so swapping whole course
+        # blocks keeps every child's slot counts intact. The (faculty, room) assignment and
+        # the (day, period) placement of each course are inherited independently.
+        row_course = population[0, :, COURSE]
+        crossing = (self.rng.random(n_pairs) < self.crossover_rate)[:, np.newaxis]
+        assignment_swap = (self.rng.random((n_pairs, len(request.courses))) < 0.5) & crossing
+        time_swap = (self.rng.random((n_pairs, len(request.courses))) < 0.5) & crossing
+        
+        swap = np.zeros((n_pairs,) + population.shape[1:], dtype=bool)
+        swap[:, :, [DAY, PERIOD]] = time_swap[:, row_course, np.newaxis]
+        swap[:, :, [FACULTY, ROOM]] = assignment_swap[:, row_course, np.newaxis]
+        
+        first, second = population[0:2 * n_pairs:2], population[1:2 * n_pairs:2]
+        first_values = np.where(swap, first, 0)
+        np.copyto(first, second, where=swap)
+        np.copyto(second, first_values, where=swap)
     
-    def _mutate(self, individual: Individual, request: OptimizationRequest) -> Individual:
-        """Random mutation"""
-        if not individual.timetable_slots:
-            return individual
-        
-        # Select random slot to mutate
-        slot_index = random.randint(0, len(individual.timetable_slots) - 1)
-        slot = individual.timetable_slots[slot_index]
-        
-        # Create new mutated slot
-        new_slot = TimetableSlot(
-            day=random.choice(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']),
-            time_start=slot.time_start,
-            time_end=slot.time_end,
-            course_id=slot.course_id,
-            faculty_id=random.choice(request.faculty).id,
-            room_id=random.choice(request.rooms).id,
-            student_groups=slot.student_groups
-        )
-        
-        # Replace slot
-        new_slots = individual.timetable_slots.copy()
-        new_slots[slot_index] = new_slot
-        
-        return Individual(new_slots)
+    def _mutate(self, population: np.ndarray, request: OptimizationRequest):
+        """Random mutation, in place"""
+        n_individuals, n_slots = population.shape[:2]
+        if not n_slots:
+            return
+        
+        # Each mutating individual moves one random slot to a random day (keeping the
+        # period) and a random suitable room for its course
+        mutants = np.flatnonzero(self.rng.random(n_individuals) < self.mutation_rate)
+        slots = self.rng.integers(0, n_slots, size=mutants.size)
+        courses = population[mutants, slots, COURSE]
+        population[mutants, slots, DAY] = self.rng.integers(0, len(DAYS), size=mutants.size)
+        population[mutants, slots, ROOM] = self._room_choices[
+            courses, self.rng.integers(0, self._room_choice_counts[courses])]
+        
+        # Faculty are reassigned per course by optimal assignment rather than drawn at random
+        for individual in np.flatnonzero(self.rng.random(n_individuals) < self.mutation_rate):
+            self._repair_faculty(population[individual])
     
-    def _generate_time_mapping(self, config) -> Dict[int, Dict[str, str]]:
-        """Generate mapping from slot numbers to actual times"""
-        from datetime import datetime, timedelta
-        
-        start_time = datetime.strptime(config.college_start_time, "%H:%M")
-        slot_duration = timedelta(minutes=config.slot_duration_minutes)
-        
-        time_mapping = {}
-        current_time = start_time
-        
-        for slot in range(config.slots_per_day):
-            time_mapping[slot] = {
-                'start': current_time.strftime("%H:%M"),
-                'end': (current_time + slot_duration).strftime("%H:%M")
-            }
-            current_time += slot_duration
-        
-        return time_mapping
+    def _repair_faculty(self, individual: np.ndarray):
+        """Reassign a random subset of courses to distinct faculty via the Hungarian algorithm, in place"""
+        n_courses, n_faculty = self._assignment_cost.shape
+        courses = self.rng.choice(n_courses, size=min(n_courses, n_faculty), replace=False)
+        
+        # Faculty load without the courses being reassigned
+        row_course = individual[:, COURSE]
+        moving = np.isin(row_course, courses)
+        load = np.bincount(individual[~moving, FACULTY], minlength=n_faculty)
+        
+        credits = self.indexed.credits[courses, np.newaxis]
+        max_workload = self.indexed.max_workload[np.newaxis, :]
+        new_load = load[np.newaxis, :] + credits
+        cost = (self._assignment_cost[courses]
+                + new_load / np.maximum(max_workload, 1)
+                + OVERLOAD_COST * (new_load > max_workload)
+                + REPAIR_NOISE * self.rng.random((len(courses), n_faculty)))
+        
+        rows, faculty = linear_sum_assignment(cost)
+        assigned = np.full(n_courses, -1, dtype=np.int32)
+        assigned[courses[rows]] = faculty
+        individual[moving, FACULTY] = assigned[row_course[moving]]
     
-    def _calculate_workload_distribution(self, request: OptimizationRequest, timetable_slots: List[TimetableSlot]) -> Dict[str, int]:
+    def _calculate_workload_distribution(self, request: OptimizationRequest, individual: np.ndarray) -> Dict[str, int]:
         """Calculate workload distribution across faculty"""
-        workload = {}
-        
-        for slot in timetable_slots:
-            if slot.faculty_id:
-                workload[slot.faculty_id] = workload.get(slot.faculty_id, 0) + 1
+        workloads = np.bincount(individual[:, FACULTY], minlength=len(request.faculty))
         
-        return workload
\ No newline at end of file
+        return {request.faculty[f].id: int(workloads[f]) for f in np.flatnonzero(workloads)}
@@ -0,0 +1,55 @@
+"""
+Hybrid optimizer: a genetic search warm-starts the CP-SAT model
+"""
+import math
+import time
+from typing import List, Optional
+from .base_optimizer import BaseOptimizer
+from .csp_optimizer import CSPOptimizer
+from .genetic_optimizer import GeneticOptimizer
+from ..models import OptimizationRequest, OptimizationResult
+from ..utils.indexed_request import IndexedRequest
+
+class HybridOptimizer(BaseOptimizer):
+    """
+    Runs the genetic algorithm, then hands its best timetable to CP-SAT as a solution hint
+    
+    Not a separate algorithm: the engine runs it for 'csp' when CSP_GA_WARM_START is set.
+    """
+    
+    def __init__(self):
+        super().__init__("Hybrid-GA-CSP")
+        self.genetic = GeneticOptimizer()
+        self.csp = CSPOptimizer()
+    
+    def optimize(self, request: OptimizationRequest, indexed: Optional[IndexedRequest] = None,
+                 deadline: float = math.inf) -> OptimizationResult:
+        """
+        Optimize timetable with a genetic warm start followed by CP-SAT polishing
+        """
+        start_time = time.time()
+        self.indexed = indexed or IndexedRequest(request)
+        
+        # The genetic phase gets at most half of the remaining budget
+        genetic_deadline = time.monotonic() + self.remaining_time(deadline) / 2 if deadline != math.inf else math.inf
+        genetic_result = self.genetic.optimize(request, self.indexed, genetic_deadline)
+        
+        csp_result = self.csp.optimize(request, self.indexed, deadline,
+                                       hint=genetic_result.timetable_slots if genetic_result.success else None)
+        
+        # The CP-SAT model has no time-conflict constraints, so polishing can make the genetic
+        # timetable worse; keep whichever result has fewer conflicts, then the higher score
+        candidates = [candidate for candidate in (csp_result, genetic_result) if candidate.success]
+        result = min(
+            candidates,
+            key=lambda candidate: (len(candidate.conflicts), -candidate.optimization_score)
+        ) if candidates else csp_result
+        
+        return result.model_copy(update={
+            "algorithm_used": self.name,
+            "execution_time_seconds": time.time() - start_time
+        })
+    
+    def validate_constraints(self, request: OptimizationRequest) -> List[str]:
+        """Validate input constraints (the CP-SAT model must be buildable)"""
+        return self.csp.validate_constraints(request)
@@ -1,11 +1,29 @@
 """
 Integer Linear Programming (ILP) based timetable optimizer using PuLP
 """
+import functools
+import itertools
+import math
 import time
-from typing import List, Dict, Any
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Callable, Hashable, Mapping, Optional, Tuple
+import numpy as np
 import pulp
+from config.settings import settings
 from .base_optimizer import BaseOptimizer
-from ..models import OptimizationRequest, OptimizationResult, TimetableSlot
+from ..models import DAYS, OptimizationRequest, OptimizationResult, TimetableSlot
+from ..utils.indexed_request import IndexedRequest
+
+# Backends tried when no solver is configured, fastest first; PuLP always bundles CBC.
+# 'HiGHS' (highspy) and 'GUROBI' (gurobipy) solve in-process; the *_CMD backends round-trip through files
+SOLVER_PREFERENCE = ('HiGHS', 'HiGHS_CMD', 'GUROBI', 'GUROBI_CMD', 'COIN_CMD', 'PULP_CBC_CMD')
+CBC_SOLVERS = ('COIN_CMD', 'PULP_CBC_CMD')
+WARM_START_SOLVERS = ('HiGHS_CMD', 'GUROBI_CMD', 'COIN_CMD', 'PULP_CBC_CMD')  # Accept a MIP start file
+
+@functools.lru_cache(maxsize=1)
+def available_solvers() -> Tuple[str, ...]:
+    """PuLP solver names usable in this environment (probing binaries is slow, so done once)"""
+    return tuple(pulp.listSolvers(onlyAvailable=True))
 
 class ILPOptimizer(BaseOptimizer):
     """ILP-based timetable optimizer using PuLP"""
@@ -14,12 +32,25 @@ class ILPOptimizer(BaseOptimizer):
         super().__init__("ILP-PuLP")
         self.problem = None
         self.variables = {}
+        self._last_solution: Dict[Tuple, float] = {}  # Schedule variable values of the previous solve, by key
+        self._model_fingerprint: Optional[Tuple] = None  # Inputs self.problem was built from
     
-    def optimize(self, request: OptimizationRequest) -> OptimizationResult:
+    def optimize(self, request: OptimizationRequest, indexed: Optional[IndexedRequest] = None,
+                 deadline: float = math.inf, hint: Optional[List[TimetableSlot]] = None,
+                 solver_options: Optional[Mapping[str, Any]] = None) -> OptimizationResult:
         """
         Optimize timetable using Integer Linear Programming approach
+        
+        Args:
+            request: OptimizationRequest containing all input data
+            indexed: Prebuilt lookup indexes for the request (built on demand if omitted)
+            deadline: time.monotonic() value by which to return the best solution found so far
+            hint: Timetable from another optimizer passed to the solver as a MIP start; without one,
+                the previous solve's values are reused when the model has the same variables
+            solver_options: Per-call solver tuning ('time_limit', 'mip_gap', 'threads') overriding settings
         """
         start_time = time.time()
+        self.indexed = indexed or IndexedRequest(request)
         
         # Validate constraints
         violations = self.validate_constraints(request)
@@ -34,30 +65,47 @@ class ILPOptimizer(BaseOptimizer):
             )
         
         try:
-            # Create ILP problem
-            self._create_problem(request)
-            
-            # Add variables
-            self._add_variables(request)
-            
-            # Add constraints
-            self._add_constraints(request)
+            # Re-solve the previous model when the request would rebuild it unchanged
+            fingerprint = self._fingerprint(request)
+            if fingerprint != self._model_fingerprint:
+                self._model_fingerprint = None
+                
+                # Create ILP problem
+                self._create_problem(request)
+                
+                # Add variables
+                self._add_variables(request)
+                
+                # Add constraints
+                self._add_constraints(request)
+                
+                # Set objective
+                self._set_objective(request)
+                
+                self._model_fingerprint = fingerprint
             
-            # Set objective
-            self._set_objective(request)
+            # Seed the branch-and-bound with an incumbent when one is available
+            warm_start = self._set_initial_values(request, hint)
             
-            # Solve problem
-            self.problem.solve(pulp.PULP_CBC_CMD(msg=0))
+            # Solve problem within the remaining time budget
+            time_limit = self.remaining_time(deadline) if deadline != math.inf else None
+            solver = self._make_solver(request, time_limit, warm_start, solver_options)
+            self.problem.solve(solver)
             
             if self.problem.status == pulp.LpStatusOptimal:
+                self._last_solution = {
+                    key: var.varValue for key, var in zip(self._schedule_keys, self._schedule_vars)
+                }
+                
                 # Extract solution
-                timetable_slots = self._extract_solution(request)
+                selected = self._selected_assignments()
+                timetable_slots = self._extract_solution(request, selected)
                 conflicts = self.detect_conflicts(timetable_slots)
-                workload_dist = self._calculate_workload_distribution(request, timetable_slots)
+                workload_dist = self._calculate_workload_distribution(request, selected)
                 
                 result = OptimizationResult(
                     success=True,
-                    message="Optimal solution found",
+                    message=f"{'Feasible' if request.config.feasibility_only else 'Optimal'} solution found with {solver.name}",
                     timetable_slots=timetable_slots,
                     conflicts=conflicts,
                     execution_time_seconds=time.time() - start_time,
@@ -66,8 +114,9 @@ class ILPOptimizer(BaseOptimizer):
                     workload_distribution=workload_dist
                 )
                 
-                result.optimization_score = self.calculate_optimization_score(result)
-                return result
+                return result.model_copy(
+                    update={"optimization_score": self.calculate_optimization_score(result)}
+                )
                 
             elif self.problem.status == pulp.LpStatusInfeasible:
                 return OptimizationResult(
@@ -111,21 +160,114 @@ class ILPOptimizer(BaseOptimizer):
         if not request.rooms:
             violations.append("No rooms provided")
         
+        # Check the requested MILP backend
+        solver_name = request.config.solver_name
+        if solver_name and solver_name not in available_solvers():
+            violations.append(
+                f"ILP solver '{solver_name}' is not available (available: {', '.join(available_solvers()) or 'none'})"
+            )
+        
         # Check faculty capacity
-        total_course_credits = sum(course.credits for course in request.courses)
-        total_faculty_capacity = sum(faculty.max_workload_hours for faculty in request.faculty)
+        total_course_credits, total_faculty_capacity, unseatable = self.check_resources(request)
         
         if total_course_credits > total_faculty_capacity:
             violations.append(f"Insufficient faculty capacity: need {total_course_credits} hours, have {total_faculty_capacity}")
         
         # Check room capacity for each course
-        for course in request.courses:
-            suitable_rooms = [r for r in request.rooms if r.capacity >= course.student_strength]
-            if not suitable_rooms:
-                violations.append(f"No room with sufficient capacity for course {course.code} (needs {course.student_strength} seats)")
+        for c in unseatable:
+            course = request.courses[c]
+            violations.append(f"No room with sufficient capacity for course {course.code} (needs {course.student_strength} seats)")
         
         return violations
     
+    def _make_solver(self, request: OptimizationRequest, time_limit: Optional[float],
+                     warm_start: bool = False, solver_options: Optional[Mapping[str, Any]] = None) -> pulp.LpSolver:
+        """Instantiate the requested (or fastest available) MILP backend with threads, gap and time limit"""
+        config = settings.get_algorithm_config('ilp')
+        solver_options = solver_options or {}
+        if solver_options.get('time_limit'):
+            time_limit = min(time_limit or math.inf, solver_options['time_limit'])
+        available = available_solvers()
+        # An unavailable request.config.solver_name is rejected by validate_constraints; an
+        # unavailable ILP_SOLVER falls back, and the result message names the backend used
+        name = request.config.solver_name or config.get('solver')
+        if name not in available:
+            # The in-process 'HiGHS' API ignores MIP starts, so a warm-started solve picks the
+            # fastest backend that accepts one (PULP_CBC_CMD always does)
+            preference = [solver for solver in SOLVER_PREFERENCE if solver in WARM_START_SOLVERS] \
+                if warm_start else SOLVER_PREFERENCE
+            name = next((solver for solver in preference if solver in available), None) \
+                or next((solver for solver in SOLVER_PREFERENCE if solver in available), None)
+            if name is None:
+                raise RuntimeError(f"No MILP backend available (PuLP reports {', '.join(available) or 'none'})")
+        
+        options = {
+            'msg': False,
+            'timeLimit': time_limit,
+            'gapRel': solver_options.get('mip_gap', config.get('mip_gap')),
+            'threads': request.config.solver_threads or solver_options.get('threads') or config.get('threads')
+        }
+        if name in CBC_SOLVERS:
+            # Reproducible branching; presolve and cuts are CBC's defaults but stated explicitly
+            options['options'] = [f"randomCbcSeed {settings.RANDOM_SEED}", "preprocess on", "cuts on"]
+            if request.config.feasibility_only:
+                # Stop at the first incumbent and skip bound-tightening cuts
+                options['options'] = [f"randomCbcSeed {settings.RANDOM_SEED}", "preprocess on", "cuts off",
+                                      "heuristicsOnOff on", "maxSolutions 1"]
+        if warm_start and name in WARM_START_SOLVERS:
+            options['warmStart'] = True
+        return pulp.getSolver(name, **options)
+    
+    def _set_initial_values(self, request: OptimizationRequest, hint: Optional[List[TimetableSlot]]) -> bool:
+        """Set schedule variable initial values from the hint or the previous solve; True if any were set"""
+        schedule = self.variables['schedule']
+        
+        if hint:
+            # A hint from another optimizer may use interchangeable rooms/faculty in any order, which
+            # the symmetry rows would reject as a MIP start; swap them into the order the rows require
+            hint = [slot for slot in hint if slot.slot_index is not None]
+            room_of = self._symmetric_relabeling(self._room_groups, Counter(slot.room_id for slot in hint))
+            faculty_of = self._symmetric_relabeling(self._faculty_groups, Counter(slot.faculty_id for slot in hint))
+            slots_per_day = request.config.slots_per_day
+            hinted = {
+                (slot.course_id, *divmod(slot.slot_index, slots_per_day),
+                 faculty_of.get(slot.faculty_id, slot.faculty_id), room_of.get(slot.room_id, slot.room_id))
+                for slot in hint
+            }
+            for key, var in schedule.items():
+                var.setInitialValue(1 if key in hinted else 0)
+            return True
+        
+        # Reuse the previous incumbent only for an identically shaped model
+        previous = self._last_solution
+        if len(previous) != len(schedule) or any(key not in previous for key in schedule):
+            return False
+        for key, var in schedule.items():
+            if previous[key] is not None:
+                var.setInitialValue(previous[key])
+        return True
+    
+    @staticmethod
+    def _symmetric_relabeling(groups: List[List[Any]], usage: Counter) -> Dict[str, str]:
+        """Id swaps within each symmetry group that make usage non-increasing in id order"""
+        relabeling = {}
+        for members in groups:
+            # sorted() is stable, so equally used members keep their id order
+            by_usage = sorted(members, key=lambda item: -usage[item.id])
+            relabeling.update((item.id, target.id) for item, target in zip(by_usage, members))
+        return relabeling
+    
+    @staticmethod
+    def _fingerprint(request: OptimizationRequest) -> Tuple:
+        """Every request field the model is built from; equal fingerprints give identical models"""
+        return (
+            request.config.slots_per_day,
+            request.config.feasibility_only,
+            tuple((c.id, c.name, c.credits, c.student_strength) for c in request.courses),
+            tuple((f.id, tuple(f.specializations), f.max_workload_hours) for f in request.faculty),
+            tuple((r.id, r.capacity, r.room_type) for r in request.rooms)
+        )
+    
     def _create_problem(self, request: OptimizationRequest):
         """Create the ILP problem"""
         self.problem = pulp.LpProblem("Timetable_Optimization", pulp.LpMinimize)
@@ -134,244 +276,189 @@ class ILPOptimizer(BaseOptimizer):
         """Add decision variables to the problem"""
         self.variables = {}
         
-        # Time slots
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-        time_slots = list(range(request.config.slots_per_day))
+        # Id lists shared by the constraint, objective and extraction passes
+        self.course_ids = [course.id for course in request.courses]
+        self.faculty_ids = [faculty.id for faculty in request.faculty]
+        self.room_ids = [room.id for room in request.rooms]
+        self.days = list(range(len(DAYS)))  # Day positions; names are only needed at extraction
+        self.time_slots = list(range(request.config.slots_per_day))
         
-        # Binary variable: x[c,d,t,f,r] = 1 if course c is scheduled on day d, time t, with faculty f, in room r
-        self.variables['schedule'] = {}
-        for course in request.courses:
-            for day in days:
-                for slot in time_slots:
-                    for faculty in request.faculty:
-                        for room in request.rooms:
-                            var_name = f"x_{course.id}_{day}_{slot}_{faculty.id}_{room.id}"
-                            self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)] = \
-                                pulp.LpVariable(var_name, cat='Binary')
+        # Rooms too small for a course never get a variable (capacity is a hard filter, not a penalty)
+        self.rooms_for_course = {
+            course_id: [room.id for room in rooms] for course_id, rooms in self.indexed.suitable_rooms.items()
+        }
+        
+        # Binary variable: x[c,d,t,f,r] = 1 if course c is scheduled on day d, time t, with faculty f, in room r.
+        # Variables are named by position ("x0", "x1", ...) to keep the solver's model file small
+        self._schedule_keys = [
+            key
+            for course_id in self.course_ids
+            for key in itertools.product([course_id], self.days, self.time_slots, self.faculty_ids,
+                                         self.rooms_for_course[course_id])
+        ]
+        self._schedule_vars = [pulp.LpVariable(f"x{i}", cat=pulp.LpBinary) for i in range(len(self._schedule_keys))]
+        self.variables['schedule'] = dict(zip(self._schedule_keys, self._schedule_vars))
+        
+        # Fixed-order faculty index of the schedule variables for vectorized solution reads
+        self._schedule_faculty = np.fromiter(
+            (self.indexed.faculty_by_id[key[3]] for key in self._schedule_keys),
+            dtype=np.int32, count=len(self._schedule_keys)
+        )
         
         # Conflict variables for soft constraints
         self.variables['conflicts'] = {}
         
         # Faculty overload variables
-        for faculty in request.faculty:
-            var_name = f"overload_{faculty.id}"
-            self.variables['conflicts'][f"faculty_overload_{faculty.id}"] = \
-                pulp.LpVariable(var_name, lowBound=0, cat='Continuous')
-        
-        # Room capacity violation variables
-        for course in request.courses:
-            for room in request.rooms:
-                if room.capacity < course.student_strength:
-                    var_name = f"capacity_violation_{course.id}_{room.id}"
-                    self.variables['conflicts'][f"capacity_{course.id}_{room.id}"] = \
-                        pulp.LpVariable(var_name, cat='Binary')
+        for faculty_id in self.faculty_ids:
+            self.variables['conflicts'][f"faculty_overload_{faculty_id}"] = \
+                pulp.LpVariable(f"overload_{faculty_id}", lowBound=0, cat='Continuous')
     
     def _add_constraints(self, request: OptimizationRequest):
         """Add constraints to the problem"""
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-        time_slots = list(range(request.config.slots_per_day))
+        days, time_slots = self.days, self.time_slots
+        
+        # Group the schedule variables once; every constraint below sums one of these groups
+        by_course = defaultdict(list)
+        by_faculty_slot = defaultdict(list)
+        by_room_slot = defaultdict(list)
+        by_faculty = defaultdict(list)
+        by_room = defaultdict(list)
+        by_course_faculty = defaultdict(list)
+        for key, var in self.variables['schedule'].items():
+            course_id, day, slot, faculty_id, room_id = key
+            by_course[course_id].append(var)
+            by_faculty_slot[faculty_id, day, slot].append(var)
+            by_room_slot[room_id, day, slot].append(var)
+            by_faculty[faculty_id].append(var)
+            by_room[room_id].append(var)
+            by_course_faculty[course_id, faculty_id].append(var)
         
         # Constraint 1: Each course must be scheduled for exactly its credit hours
         for course in request.courses:
-            schedule_sum = []
-            for day in days:
-                for slot in time_slots:
-                    for faculty in request.faculty:
-                        for room in request.rooms:
-                            if (course.id, day, slot, faculty.id, room.id) in self.variables['schedule']:
-                                schedule_sum.append(self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)])
-            
-            if schedule_sum:
-                self.problem += pulp.lpSum(schedule_sum) == course.credits, f"Course_Hours_{course.id}"
+            self.problem += pulp.lpSum(by_course[course.id]) == course.credits, f"Course_Hours_{course.id}"
         
         # Constraint 2: No faculty conflicts (one faculty per time slot)
-        for faculty in request.faculty:
+        for faculty_id in self.faculty_ids:
             for day in days:
                 for slot in time_slots:
-                    faculty_assignments = []
-                    for course in request.courses:
-                        for room in request.rooms:
-                            if (course.id, day, slot, faculty.id, room.id) in self.variables['schedule']:
-                                faculty_assignments.append(self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)])
-                    
-                    if faculty_assignments:
-                        self.problem += pulp.lpSum(faculty_assignments) <= 1, f"Faculty_Conflict_{faculty.id}_{day}_{slot}"
+                    self.problem += pulp.lpSum(by_faculty_slot[faculty_id, day, slot]) <= 1, \
+                                    f"Faculty_Conflict_{faculty_id}_{day}_{slot}"
         
         # Constraint 3: No room conflicts (one course per room per time slot)
-        for room in request.rooms:
+        for room_id in self.room_ids:
             for day in days:
                 for slot in time_slots:
-                    room_assignments = []
-                    for course in request.courses:
-                        for faculty in request.faculty:
-                            if (course.id, day, slot, faculty.id, room.id) in self.variables['schedule']:
-                                room_assignments.append(self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)])
-                    
+                    room_assignments = by_room_slot.get((room_id, day, slot))
                     if room_assignments:
-                        self.problem += pulp.lpSum(room_assignments) <= 1, f"Room_Conflict_{room.id}_{day}_{slot}"
+                        self.problem += pulp.lpSum(room_assignments) <= 1, f"Room_Conflict_{room_id}_{day}_{slot}"
         
         # Constraint 4: Faculty workload limits (soft constraint with penalty)
+        # The workload expressions are kept for the balance objective
+        self.faculty_workload = {}
         for faculty in request.faculty:
-            faculty_workload = []
-            for course in request.courses:
-                for day in days:
-                    for slot in time_slots:
-                        for room in request.rooms:
-                            if (course.id, day, slot, faculty.id, room.id) in self.variables['schedule']:
-                                faculty_workload.append(self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)])
-            
-            if faculty_workload and f"faculty_overload_{faculty.id}" in self.variables['conflicts']:
-                self.problem += (pulp.lpSum(faculty_workload) - faculty.max_workload_hours <= 
-                               self.variables['conflicts'][f"faculty_overload_{faculty.id}"]), \
-                               f"Faculty_Workload_{faculty.id}"
+            self.faculty_workload[faculty.id] = pulp.lpSum(by_faculty[faculty.id])
+            self.problem += (self.faculty_workload[faculty.id] - faculty.max_workload_hours <= 
+                           self.variables['conflicts'][f"faculty_overload_{faculty.id}"]), \
+                           f"Faculty_Workload_{faculty.id}"
         
-        # Constraint 5: Room capacity (soft constraint with penalty)
-        for course in request.courses:
-            for room in request.rooms:
-                if room.capacity < course.student_strength:
-                    for day in days:
-                        for slot in time_slots:
-                            for faculty in request.faculty:
-                                if (course.id, day, slot, faculty.id, room.id) in self.variables['schedule'] and \
-                                   f"capacity_{course.id}_{room.id}" in self.variables['conflicts']:
-                                    self.problem += (self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)] <= 
-                                                   self.variables['conflicts'][f"capacity_{course.id}_{room.id}"]), \
-                                                   f"Capacity_Violation_{course.id}_{room.id}_{day}_{slot}_{faculty.id}"
-        
-        # Constraint 6: Faculty specialization preferences (soft)
-        for course in request.courses:
-            qualified_faculty = [f for f in request.faculty if any(spec.lower() in course.name.lower() for spec in f.specializations)]
-            if qualified_faculty:
-                # Encourage assignment to qualified faculty
-                qualified_assignments = []
-                unqualified_assignments = []
-                
-                for day in days:
-                    for slot in time_slots:
-                        for room in request.rooms:
-                            for faculty in request.faculty:
-                                if (course.id, day, slot, faculty.id, room.id) in self.variables['schedule']:
-                                    if faculty in qualified_faculty:
-                                        qualified_assignments.append(self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)])
-                                    else:
-                                        unqualified_assignments.append(self.variables['schedule'][(course.id, day, slot, faculty.id, room.id)])
-                
-                # Prefer qualified faculty (soft constraint)
-                if qualified_assignments and unqualified_assignments:
-                    qualification_penalty = f"qualification_penalty_{course.id}"
-                    self.variables['conflicts'][qualification_penalty] = pulp.LpVariable(qualification_penalty, cat='Binary')
-                    
-                    # If any unqualified faculty is assigned, activate penalty
-                    if unqualified_assignments:
-                        self.problem += (pulp.lpSum(unqualified_assignments) <= 
-                                       len(unqualified_assignments) * self.variables['conflicts'][qualification_penalty]), \
-                                       f"Qualification_Penalty_{course.id}"
+        # Constraint 5: Symmetry breaking - interchangeable rooms/faculty are used in non-increasing order.
+        # The groups are kept so hints can be relabeled into the same order
+        self._room_groups = self._symmetry_groups(request.rooms, lambda room: (room.capacity, room.room_type))
+        self._faculty_groups = self._symmetry_groups(
+            request.faculty, lambda faculty: (faculty.max_workload_hours, frozenset(faculty.specializations)))
+        for members in self._room_groups:
+            for first, second in zip(members, members[1:]):
+                self.problem += pulp.lpSum(by_room[first.id]) >= pulp.lpSum(by_room[second.id]), \
+                                f"Room_Symmetry_{first.id}_{second.id}"
+        for members in self._faculty_groups:
+            for first, second in zip(members, members[1:]):
+                self.problem += self.faculty_workload[first.id] >= self.faculty_workload[second.id], \
+                                f"Faculty_Symmetry_{first.id}_{second.id}"
+        
+        # Kept for the qualification costs in the objective
+        self.by_course_faculty = by_course_faculty
+    
+    @staticmethod
+    def _symmetry_groups(items: List[Any], key: Callable[[Any], Hashable]) -> List[List[Any]]:
+        """Groups of two or more items the model cannot tell apart, each sorted by id"""
+        groups = defaultdict(list)
+        for item in items:
+            groups[key(item)].append(item)
+        return [sorted(members, key=lambda item: item.id) for members in groups.values() if len(members) > 1]
     
     def _set_objective(self, request: OptimizationRequest):
         """Set the optimization objective"""
+        if request.config.feasibility_only:
+            # Constant objective: any feasible timetable is optimal, so every backend stops at the first one
+            self.problem += pulp.LpAffineExpression(), "Feasibility_Only"
+            return
+        
         objective_terms = []
         
         # Minimize conflicts and violations
         for var_name, var in self.variables['conflicts'].items():
             if 'overload' in var_name:
                 objective_terms.append(10 * var)  # High penalty for faculty overload
-            elif 'capacity' in var_name:
-                objective_terms.append(20 * var)  # Very high penalty for capacity violations
-            elif 'qualification' in var_name:
-                objective_terms.append(5 * var)   # Medium penalty for qualification mismatch
         
-        # Add workload balance objective
+        # Medium penalty on every session taught by unqualified faculty, when qualified faculty exist
+        for course in request.courses:
+            qualified_ids = {faculty.id for faculty in self.indexed.qualified_faculty[course.id]}
+            if qualified_ids and len(qualified_ids) < len(self.faculty_ids):
+                objective_terms.append(5 * pulp.lpSum(
+                    var
+                    for faculty_id in self.faculty_ids if faculty_id not in qualified_ids
+                    for var in self.by_course_faculty[course.id, faculty_id]
+                ))
+        
+        # Add workload balance objective: minimize the spread between the most and least loaded faculty
         if len(request.faculty) > 1:
-            # Add workload variance minimization (simplified)
-            for i, faculty1 in enumerate(request.faculty):
-                for faculty2 in request.faculty[i+1:]:
-                    # Add variables for workload difference
-                    diff_var = pulp.LpVariable(f"workload_diff_{faculty1.id}_{faculty2.id}", lowBound=0)
-                    self.variables['conflicts'][f"workload_diff_{faculty1.id}_{faculty2.id}"] = diff_var
-                    
-                    # Calculate workload for each faculty
-                    workload1 = []
-                    workload2 = []
-                    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-                    time_slots = list(range(request.config.slots_per_day))
-                    
-                    for course in request.courses:
-                        for day in days:
-                            for slot in time_slots:
-                                for room in request.rooms:
-                                    if (course.id, day, slot, faculty1.id, room.id) in self.variables['schedule']:
-                                        workload1.append(self.variables['schedule'][(course.id, day, slot, faculty1.id, room.id)])
-                                    if (course.id, day, slot, faculty2.id, room.id) in self.variables['schedule']:
-                                        workload2.append(self.variables['schedule'][(course.id, day, slot, faculty2.id, room.id)])
-                    
-                    # Add constraints for absolute difference
-                    if workload1 and workload2:
-                        self.problem += (pulp.lpSum(workload1) - pulp.lpSum(workload2) <= diff_var), \
-                                       f"Workload_Diff_Pos_{faculty1.id}_{faculty2.id}"
-                        self.problem += (pulp.lpSum(workload2) - pulp.lpSum(workload1) <= diff_var), \
-                                       f"Workload_Diff_Neg_{faculty1.id}_{faculty2.id}"
-                    
-                    # Add to objective with lower weight
-                    objective_terms.append(2 * diff_var)
+            w_min = pulp.LpVariable("w_min", lowBound=0)
+            w_max = pulp.LpVariable("w_max", lowBound=0)
+            self.variables['conflicts']['workload_min'] = w_min
+            self.variables['conflicts']['workload_max'] = w_max
+            
+            for faculty_id, workload in self.faculty_workload.items():
+                self.problem += workload >= w_min, f"Workload_Min_{faculty_id}"
+                self.problem += workload <= w_max, f"Workload_Max_{faculty_id}"
+            
+            # Add to objective with lower weight
+            objective_terms.append(2 * (w_max - w_min))
         
         # Set the objective
         if objective_terms:
             self.problem += pulp.lpSum(objective_terms), "Minimize_Conflicts_and_Balance_Workload"
         else:
             # Fallback objective - minimize total assignments (should not happen with proper constraints)
-            all_assignments = []
-            for var in self.variables['schedule'].values():
-                all_assignments.append(var)
-            if all_assignments:
-                self.problem += pulp.lpSum(all_assignments), "Minimize_Total_Assignments"
+            self.problem += pulp.lpSum(self.variables['schedule'].values()), "Minimize_Total_Assignments"
     
-    def _extract_solution(self, request: OptimizationRequest) -> List[TimetableSlot]:
+    def _selected_assignments(self) -> np.ndarray:
+        """Positions (in _schedule_keys order) of the schedule variables set to 1"""
+        values = np.fromiter((var.varValue or 0.0 for var in self._schedule_vars), dtype=np.float64,
+                             count=len(self._schedule_vars))
+        return np.flatnonzero(values > 0.5)  # Binary variable is 1
+    
+    def _extract_solution(self, request: OptimizationRequest, selected: np.ndarray) -> List[TimetableSlot]:
         """Extract timetable solution from solved problem"""
-        timetable_slots = []
+        # Period start/end times for the configured day
+        periods = request.config.slot_indices()
+        slots_per_day = request.config.slots_per_day
         
-        # Generate time mapping
-        time_mapping = self._generate_time_mapping(request.config)
-        
-        for (course_id, day, slot, faculty_id, room_id), var in self.variables['schedule'].items():
-            if var.varValue and var.varValue > 0.5:  # Binary variable is 1
-                time_info = time_mapping[slot]
-                timetable_slots.append(TimetableSlot(
-                    day=day,
-                    time_start=time_info['start'],
-                    time_end=time_info['end'],
-                    course_id=course_id,
-                    faculty_id=faculty_id,
-                    room_id=room_id,
-                    student_groups=[course_id]  # Simplified
-                ))
+        timetable_slots = []
+        for i in selected:
+            course_id, day, slot, faculty_id, room_id = self._schedule_keys[i]
+            timetable_slots.append(TimetableSlot.from_index(
+                day * slots_per_day + slot,
+                periods,
+                course_id=course_id,
+                faculty_id=faculty_id,
+                room_id=room_id,
+                student_groups=[course_id]  # Simplified
+            ))
         
         return timetable_slots
     
-    def _generate_time_mapping(self, config) -> Dict[int, Dict[str, str]]:
-        """Generate mapping from slot numbers to actual times"""
-        from datetime import datetime, timedelta
-        
-        start_time = datetime.strptime(config.college_start_time, "%H:%M")
-        slot_duration = timedelta(minutes=config.slot_duration_minutes)
-        
-        time_mapping = {}
-        current_time = start_time
-        
-        for slot in range(config.slots_per_day):
-            time_mapping[slot] = {
-                'start': current_time.strftime("%H:%M"),
-                'end': (current_time + slot_duration).strftime("%H:%M")
-            }
-            current_time += slot_duration
-        
-        return time_mapping
-    
-    def _calculate_workload_distribution(self, request: OptimizationRequest, timetable_slots: List[TimetableSlot]) -> Dict[str, int]:
+    def _calculate_workload_distribution(self, request: OptimizationRequest, selected: np.ndarray) -> Dict[str, int]:
         """Calculate workload distribution across faculty"""
-        workload = {}
-        
-        for slot in timetable_slots:
-            if slot.faculty_id:
-                workload[slot.faculty_id] = workload.get(slot.faculty_id, 0) + 1
+        workloads = np.bincount(self._schedule_faculty[selected], minlength=len(request.faculty))
         
-        return workload
\ No newline at end of file
+        return {request.faculty[f].id: int(workloads[f]) for f in np.flatnonzero(workloads)}
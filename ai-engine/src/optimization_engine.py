@@ -1,23 +1,96 @@
 """
 Main optimization engine that coordinates different algorithms
 """
-from typing import Dict, List, Optional
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple, Type
+from config.settings import settings
 from .optimization.base_optimizer import BaseOptimizer
 from .optimization.csp_optimizer import CSPOptimizer
 from .optimization.genetic_optimizer import GeneticOptimizer
+from .optimization.hybrid_optimizer import HybridOptimizer
 from .optimization.ilp_optimizer import ILPOptimizer
 from .models import OptimizationRequest, OptimizationResult, OptimizationObjective
+from .utils.indexed_request import IndexedRequest
+
+# Static descriptions of the registered algorithms
+ALGORITHM_INFO: Dict[str, Dict[str, str]] = {
+    'csp': {
+        'name': 'Constraint Satisfaction Problem (OR-Tools)',
+        'description': 'Uses constraint programming to find feasible solutions quickly',
+        'best_for': 'Small to medium problems with hard constraints',
+        'strengths': 'Fast, guaranteed feasible solutions, good for conflict minimization',
+        'limitations': 'May not find optimal solutions for complex objectives'
+    },
+    'genetic': {
+        'name': 'Genetic Algorithm',
+        'description': 'Evolutionary algorithm for multi-objective optimization',
+        'best_for': 'Large problems with multiple conflicting objectives',
+        'strengths': 'Handles multiple objectives, good for workload balancing',
+        'limitations': 'No guarantee of optimality, longer execution time'
+    },
+    'ilp': {
+        'name': 'Integer Linear Programming (PuLP)',
+        'description': 'Mathematical optimization for finding optimal solutions',
+        'best_for': 'Medium problems with clear optimization criteria',
+        'strengths': 'Optimal solutions, good for cost minimization',
+        'limitations': 'May be slow for large problems, requires linear objectives'
+    }
+}
 
 class OptimizationEngine:
     """Main engine that manages different optimization algorithms"""
     
     def __init__(self):
-        self.optimizers: Dict[str, BaseOptimizer] = {
-            'csp': CSPOptimizer(),
-            'genetic': GeneticOptimizer(),
-            'ilp': ILPOptimizer()
+        # Optimizer classes by algorithm name. Instances keep per-run solver state (models,
+        # warm starts), so each thread gets its own instances from get_optimizer()
+        self.optimizers: Dict[str, Type[BaseOptimizer]] = {
+            # CSP_GA_WARM_START runs the genetic search first and hints CP-SAT with its timetable
+            'csp': HybridOptimizer if settings.get_algorithm_config('csp').get('ga_warm_start') else CSPOptimizer,
+            'genetic': GeneticOptimizer,
+            'ilp': ILPOptimizer
         }
+        self._local = threading.local()
         self.default_algorithm = 'csp'
+        
+        # Worker processes for optimize_with_multiple_algorithms, created on first use and reused
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def get_optimizer(self, algorithm: str) -> Optional[BaseOptimizer]:
+        """
+        Get this thread's instance of an optimizer, creating it on first use
+        
+        Args:
+            algorithm: Algorithm name
+            
+        Returns:
+            Optimizer instance, or None for an unknown algorithm
+        """
+        optimizer_class = self.optimizers.get(algorithm)
+        if optimizer_class is None:
+            return None
+        
+        instances = self._local.__dict__.setdefault('instances', {})
+        if algorithm not in instances:
+            instances[algorithm] = optimizer_class()
+        return instances[algorithm]
+    
+    def _shared_pool(self) -> ProcessPoolExecutor:
+        """The engine's reusable worker pool, one worker per algorithm (replaced if a worker died)"""
+        with self._pool_lock:
+            if self._pool is None or self._pool._broken:
+                self._pool = ProcessPoolExecutor(max_workers=len(self.optimizers))
+            return self._pool
+    
+    def shutdown(self):
+        """Stop the engine's worker pool, cancelling comparisons that have not started"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
     
     def get_available_algorithms(self) -> List[str]:
         """Get list of available optimization algorithms"""
@@ -34,10 +107,12 @@ class OptimizationEngine:
         Returns:
             OptimizationResult with generated timetable
         """
+        options: Dict[str, Any] = {}
         if algorithm is None:
-            algorithm = self._select_best_algorithm(request)
+            algorithm, options = self._select_best_algorithm(request)
         
-        if algorithm not in self.optimizers:
+        optimizer = self.get_optimizer(algorithm)
+        if optimizer is None:
             return OptimizationResult(
                 success=False,
                 message=f"Unknown algorithm: {algorithm}. Available: {list(self.optimizers.keys())}",
@@ -47,36 +122,89 @@ class OptimizationEngine:
                 optimization_score=0.0
             )
         
-        optimizer = self.optimizers[algorithm]
-        return optimizer.optimize(request)
+        return optimizer.optimize(request, IndexedRequest(request), self._deadline(algorithm, request), **options)
     
-    def optimize_with_multiple_algorithms(self, request: OptimizationRequest) -> Dict[str, OptimizationResult]:
+    def optimize_with_multiple_algorithms(self, request: OptimizationRequest,
+                                          first_success: bool = False) -> Dict[str, OptimizationResult]:
         """
-        Run optimization with multiple algorithms and compare results
+        Run optimization with multiple algorithms in parallel processes and compare results
         
         Args:
             request: OptimizationRequest containing all input data
+            first_success: Return as soon as one algorithm succeeds ("bet and run"); the
+                algorithms still queued or running are cancelled
             
         Returns:
-            Dictionary mapping algorithm names to their results
+            Dictionary mapping algorithm names to their results (only finished ones with first_success)
         """
+        # A first-success run uses a pool of its own: a running solver cannot be cancelled, so
+        # the losers are stopped by terminating that pool's workers, which must not be shared
+        # with other callers. Full comparisons reuse the engine's pool
+        pool = ProcessPoolExecutor(max_workers=len(self.optimizers)) if first_success else self._shared_pool()
+        futures = {
+            pool.submit(_run_single, algorithm_name, request): algorithm_name
+            for algorithm_name in self.optimizers
+        }
         results = {}
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    algorithm_name = futures[future]
+                    try:
+                        results[algorithm_name] = future.result()
+                    except Exception as e:
+                        results[algorithm_name] = self.failed_result(algorithm_name, e)
+                if first_success and any(result.success for result in results.values()):
+                    break
+        finally:
+            if first_success:
+                for process in list(pool._processes.values()):
+                    process.terminate()
+                pool.shutdown(wait=True, cancel_futures=True)
         
-        for algorithm_name, optimizer in self.optimizers.items():
-            try:
-                result = optimizer.optimize(request)
-                results[algorithm_name] = result
-            except Exception as e:
-                results[algorithm_name] = OptimizationResult(
-                    success=False,
-                    message=f"Algorithm {algorithm_name} failed: {str(e)}",
-                    timetable_slots=[],
-                    execution_time_seconds=0.0,
-                    algorithm_used=algorithm_name,
-                    optimization_score=0.0
-                )
-        
-        return results
+        # Report in the engine's algorithm order regardless of completion order
+        return {name: results[name] for name in self.optimizers if name in results}
+    
+    def run_single(self, algorithm_name: str, request: OptimizationRequest,
+                   indexed: Optional[IndexedRequest] = None) -> OptimizationResult:
+        """
+        Run a single named algorithm, converting failures into a failed result
+        
+        Args:
+            algorithm_name: Algorithm to run
+            request: OptimizationRequest containing all input data
+            indexed: Prebuilt lookup indexes shared across algorithms
+            
+        Returns:
+            OptimizationResult for the algorithm (never raises)
+        """
+        try:
+            return self.get_optimizer(algorithm_name).optimize(
+                request, indexed or IndexedRequest(request), self._deadline(algorithm_name, request)
+            )
+        except Exception as e:
+            return self.failed_result(algorithm_name, e)
+    
+    @staticmethod
+    def _deadline(algorithm_name: str, request: OptimizationRequest) -> float:
+        """Monotonic deadline from the algorithm's configured timeout, capped by the request's time limit"""
+        limits = [settings.get_algorithm_config(algorithm_name).get("timeout"), request.config.time_limit_seconds]
+        limits = [limit for limit in limits if limit]
+        return time.monotonic() + min(limits) if limits else math.inf
+    
+    @staticmethod
+    def failed_result(algorithm_name: str, error: Exception) -> OptimizationResult:
+        """Build the result reported for an algorithm that raised"""
+        return OptimizationResult(
+            success=False,
+            message=f"Algorithm {algorithm_name} failed: {str(error)}",
+            timetable_slots=[],
+            execution_time_seconds=0.0,
+            algorithm_used=algorithm_name,
+            optimization_score=0.0
+        )
     
     def get_best_result(self, results: Dict[str, OptimizationResult]) -> OptimizationResult:
         """
@@ -100,15 +228,15 @@ class OptimizationEngine:
         
         return successful_results[best_name]
     
-    def _select_best_algorithm(self, request: OptimizationRequest) -> str:
+    def _select_best_algorithm(self, request: OptimizationRequest) -> Tuple[str, Dict[str, Any]]:
         """
-        Select best algorithm based on problem characteristics
+        Select best algorithm and its size-dependent parameters based on problem characteristics
         
         Args:
             request: OptimizationRequest to analyze
             
         Returns:
-            Name of recommended algorithm
+            Name of recommended algorithm and keyword arguments for its optimize()
         """
         num_courses = len(request.courses)
         num_faculty = len(request.faculty)
@@ -120,16 +248,21 @@ class OptimizationEngine:
         # Algorithm selection heuristics
         if problem_size < 1000:
             # Small problems - CSP is typically fastest and optimal
-            return 'csp'
+            return 'csp', {}
         elif problem_size < 10000:
             # Medium problems - ILP can find optimal solutions
             if OptimizationObjective.MINIMIZE_CONFLICTS in request.objectives:
-                return 'ilp'
+                # Bound the solve by problem size and accept a 2% gap rather than closing the last percent
+                return 'ilp', {'solver_options': {
+                    'time_limit': max(5.0, 0.002 * problem_size),
+                    'mip_gap': 0.02,
+                    'threads': settings.ILP_THREADS
+                }}
             else:
-                return 'csp'
+                return 'csp', {}
         else:
             # Large problems - Genetic algorithm for multi-objective optimization
-            return 'genetic'
+            return 'genetic', {}
     
     def validate_request(self, request: OptimizationRequest) -> List[str]:
         """
@@ -143,8 +276,8 @@ class OptimizationEngine:
         """
         all_violations = []
         
-        for optimizer in self.optimizers.values():
-            violations = optimizer.validate_constraints(request)
+        for algorithm_name in self.optimizers:
+            violations = self.get_optimizer(algorithm_name).validate_constraints(request)
             all_violations.extend(violations)
         
         # Remove duplicates while preserving order
@@ -167,28 +300,13 @@ class OptimizationEngine:
         Returns:
             Dictionary with algorithm information
         """
-        algorithm_info = {
-            'csp': {
-                'name': 'Constraint Satisfaction Problem (OR-Tools)',
-                'description': 'Uses constraint programming to find feasible solutions quickly',
-                'best_for': 'Small to medium problems with hard constraints',
-                'strengths': 'Fast, guaranteed feasible solutions, good for conflict minimization',
-                'limitations': 'May not find optimal solutions for complex objectives'
-            },
-            'genetic': {
-                'name': 'Genetic Algorithm',
-                'description': 'Evolutionary algorithm for multi-objective optimization',
-                'best_for': 'Large problems with multiple conflicting objectives',
-                'strengths': 'Handles multiple objectives, good for workload balancing',
-                'limitations': 'No guarantee of optimality, longer execution time'
-            },
-            'ilp': {
-                'name': 'Integer Linear Programming (PuLP)',
-                'description': 'Mathematical optimization for finding optimal solutions',
-                'best_for': 'Medium problems with clear optimization criteria',
-                'strengths': 'Optimal solutions, good for cost minimization',
-                'limitations': 'May be slow for large problems, requires linear objectives'
-            }
-        }
-        
-        return algorithm_info.get(algorithm, {'error': f'Unknown algorithm: {algorithm}'})
\ No newline at end of file
+        return ALGORITHM_INFO.get(algorithm, {'error': f'Unknown algorithm: {algorithm}'})
+
+_engine: Optional[OptimizationEngine] = None
+
+def _run_single(algorithm_name: str, request: OptimizationRequest) -> OptimizationResult:
+    """Process pool entry point; each worker process lazily builds its own engine"""
+    global _engine
+    if _engine is None:
+        _engine = OptimizationEngine()
+    return _engine.run_single(algorithm_name, request)
@@ -1,12 +1,37 @@
 """
 Utility functions for converting data between the main application and AI engine
 """
-from typing import List, Dict, Any
+import re
+from collections import Counter
+from typing import List, Dict, Any, Iterator, Mapping, Tuple, TypedDict
+import orjson
 from ..models import (
-    OptimizationRequest, TimetableConfig, CourseData, FacultyData, 
-    RoomData, StudentData, CourseType, SessionType, OptimizationObjective
+    OptimizationRequest, OptimizationResult, TimetableConfig, CourseData, FacultyData, 
+    RoomData, StudentData, CourseType, SessionType, OptimizationObjective, describe_conflict
 )
 
+# Separator for the comma-separated list fields in storage, surrounding whitespace included
+_COMMA_SPLIT = re.compile(r'\s*,\s*')
+
+# Enum members by value; a dict hit skips the Enum constructor, misses still go through it (and raise)
+_COURSE_TYPES = {member.value: member for member in CourseType}
+_SESSION_TYPES = {member.value: member for member in SessionType}
+_OBJECTIVES = {member.value: member for member in OptimizationObjective}
+
+# Timetable configuration handed out by extract_from_storage (copied per call, callers may mutate it)
+_DEFAULT_CONFIG = {
+    "slot_duration_minutes": 50,
+    "college_start_time": "08:30",
+    "college_end_time": "17:30",
+    "slots_per_day": 8,
+    "lunch_duration_minutes": 60
+}
+
+def _split_list(value: str) -> List[str]:
+    """Split a comma-separated storage field into its non-empty, trimmed items"""
+    value = value.strip()
+    return [item for item in _COMMA_SPLIT.split(value) if item] if value else []
+
 def convert_from_main_app_format(data: Dict[str, Any]) -> OptimizationRequest:
     """
     Convert data from main application format to AI engine format
@@ -17,6 +42,9 @@ def convert_from_main_app_format(data: Dict[str, Any]) -> OptimizationRequest:
     Returns:
         OptimizationRequest object for AI engine
     """
+    # Bind the model classes and enum lookups locally; the comprehensions below call them once per row
+    course_cls, faculty_cls, room_cls, student_cls = CourseData, FacultyData, RoomData, StudentData
+    course_types, session_types, objectives_by_value = _COURSE_TYPES, _SESSION_TYPES, _OBJECTIVES
     
     # Convert timetable configuration
     config_data = data.get('config', {})
@@ -25,31 +53,35 @@ def convert_from_main_app_format(data: Dict[str, Any]) -> OptimizationRequest:
         college_start_time=config_data.get('college_start_time', '08:30'),
         college_end_time=config_data.get('college_end_time', '17:30'),
         slots_per_day=config_data.get('slots_per_day', 8),
-        break_slots=config_data.get('break_slots', []),
-        lunch_duration_minutes=config_data.get('lunch_duration_minutes', 60)
+        break_slots=config_data.get('break_slots', ()),
+        lunch_duration_minutes=config_data.get('lunch_duration_minutes', 60),
+        time_limit_seconds=config_data.get('time_limit_seconds'),
+        solver_name=config_data.get('solver_name'),
+        solver_threads=config_data.get('solver_threads'),
+        feasibility_only=config_data.get('feasibility_only', False)
     )
     
     # Convert courses
-    courses = []
-    for course_data in data.get('courses', []):
-        course = CourseData(
+    courses = [
+        course_cls(
             id=course_data['id'],
             code=course_data.get('code', ''),
             name=course_data.get('name', ''),
             credits=course_data.get('credits', 3),
-            course_type=CourseType(course_data.get('course_type', 'major')),
-            session_type=SessionType(course_data.get('session_type', 'theory')),
+            course_type=course_types.get(ctype) or CourseType(ctype),
+            session_type=session_types.get(stype) or SessionType(stype),
             student_strength=course_data.get('student_strength', 30),
             requires_lab=course_data.get('requires_lab', False),
             consecutive_slots_required=course_data.get('consecutive_slots_required', 1),
             preferred_time_slots=course_data.get('preferred_time_slots', [])
         )
-        courses.append(course)
+        for course_data in data.get('courses', [])
+        for ctype, stype in [(course_data.get('course_type', 'major'), course_data.get('session_type', 'theory'))]
+    ]
     
     # Convert faculty
-    faculty = []
-    for faculty_data in data.get('faculty', []):
-        faculty_member = FacultyData(
+    faculty = [
+        faculty_cls(
             id=faculty_data['id'],
             name=faculty_data.get('name', ''),
             email=faculty_data.get('email', ''),
@@ -58,12 +90,12 @@ def convert_from_main_app_format(data: Dict[str, Any]) -> OptimizationRequest:
             availability_slots=faculty_data.get('availability_slots', []),
             preferred_courses=faculty_data.get('preferred_courses', [])
         )
-        faculty.append(faculty_member)
+        for faculty_data in data.get('faculty', [])
+    ]
     
     # Convert rooms
-    rooms = []
-    for room_data in data.get('rooms', []):
-        room = RoomData(
+    rooms = [
+        room_cls(
             id=room_data['id'],
             name=room_data.get('name', ''),
             capacity=room_data.get('capacity', 30),
@@ -72,27 +104,26 @@ def convert_from_main_app_format(data: Dict[str, Any]) -> OptimizationRequest:
             equipment=room_data.get('equipment', []),
             course_restrictions=room_data.get('course_restrictions', [])
         )
-        rooms.append(room)
+        for room_data in data.get('rooms', [])
+    ]
     
     # Convert students
-    students = []
-    for student_data in data.get('students', []):
-        student = StudentData(
+    students = [
+        student_cls(
             id=student_data['id'],
             program_id=student_data.get('program_id', ''),
             semester=student_data.get('semester', 1),
             enrolled_courses=student_data.get('enrolled_courses', []),
             total_credits=student_data.get('total_credits', 20)
         )
-        students.append(student)
+        for student_data in data.get('students', [])
+    ]
     
     # Convert objectives
-    objectives = []
-    for obj in data.get('objectives', ['minimize_conflicts']):
-        if isinstance(obj, str):
-            objectives.append(OptimizationObjective(obj))
-        else:
-            objectives.append(obj)
+    objectives = [
+        (objectives_by_value.get(obj) or OptimizationObjective(obj)) if isinstance(obj, str) else obj
+        for obj in data.get('objectives', ['minimize_conflicts'])
+    ]
     
     return OptimizationRequest(
         config=config,
@@ -104,7 +135,7 @@ def convert_from_main_app_format(data: Dict[str, Any]) -> OptimizationRequest:
         constraints=data.get('constraints', {})
     )
 
-def convert_to_main_app_format(result: Any) -> Dict[str, Any]:
+def convert_to_main_app_format(result: OptimizationResult) -> Dict[str, Any]:
     """
     Convert AI engine result to main application format
     
@@ -114,15 +145,12 @@ def convert_to_main_app_format(result: Any) -> Dict[str, Any]:
     Returns:
         Dictionary in main application format
     """
-    from ..models import OptimizationResult
-    
-    if not isinstance(result, OptimizationResult):
+    if not hasattr(result, 'timetable_slots'):
         return {"error": "Invalid result type"}
     
     # Convert timetable slots
-    timetable_entries = []
-    for slot in result.timetable_slots:
-        entry = {
+    timetable_entries = [
+        {
             "day": slot.day,
             "time_start": slot.time_start,
             "time_end": slot.time_end,
@@ -131,18 +159,19 @@ def convert_to_main_app_format(result: Any) -> Dict[str, Any]:
             "room_id": slot.room_id,
             "student_groups": slot.student_groups
         }
-        timetable_entries.append(entry)
+        for slot in result.timetable_slots
+    ]
     
     # Convert conflicts
-    conflicts = []
-    for conflict in result.conflicts:
-        conflict_entry = {
+    conflicts = [
+        {
             "type": conflict.get("type", "unknown"),
-            "description": conflict.get("description", ""),
+            "description": describe_conflict(conflict),
             "affected_entities": conflict.get("affected_slots", []),
             "severity": conflict.get("severity", "medium")
         }
-        conflicts.append(conflict_entry)
+        for conflict in result.conflicts
+    ]
     
     return {
         "success": result.success,
@@ -155,122 +184,266 @@ def convert_to_main_app_format(result: Any) -> Dict[str, Any]:
         "workload_distribution": result.workload_distribution
     }
 
-def extract_from_storage(storage_data: Dict[str, Any]) -> Dict[str, Any]:
+def convert_to_main_app_bytes(result: OptimizationResult) -> bytes:
     """
-    Extract and format data from main application storage for AI optimization
+    Convert AI engine result to main application format, serialized as JSON
     
     Args:
-        storage_data: Raw data from main application storage
+        result: OptimizationResult from AI engine
         
     Returns:
-        Formatted data ready for AI optimization
+        UTF-8 JSON body, ready to send to the main application
     """
+    return orjson.dumps(convert_to_main_app_format(result))
+
+class FormattedStorage(TypedDict):
+    """Main application format produced by extract_from_storage (a plain dict at runtime)"""
+    config: Dict[str, Any]
+    courses: List[Dict[str, Any]]
+    faculty: List[Dict[str, Any]]
+    rooms: List[Dict[str, Any]]
+    students: List[Dict[str, Any]]
+    objectives: List[str]
+    constraints: Dict[str, Any]
+
+def _storage_indexes(storage_data: Dict[str, Any]) -> Tuple[Counter, Dict[str, List[str]],
+                                                             Dict[str, List[str]], Dict[str, int]]:
+    """(course_enrollments, assignments_by_faculty, enrollments_by_student, credits_by_id) for storage"""
+    all_courses = storage_data.get('courses', [])
+    enrollments = storage_data.get('enrollments', [])
+    assignments = storage_data.get('facultyAssignments', [])
     
-    # Extract courses with student enrollment data
-    courses = []
-    course_enrollments = {}
+    # Count enrollments per course (only the count is used, as the student strength)
+    course_enrollments = Counter(
+        course_id
+        for enrollment in enrollments
+        for course_id in [enrollment.get('courseId')]
+        if course_id
+    )
+    
+    # Group assigned course ids by faculty once instead of rescanning them per faculty member
+    assignments_by_faculty: Dict[str, List[str]] = {}
+    for assignment in assignments:
+        assignments_by_faculty.setdefault(assignment.get('facultyId'), []).append(assignment.get('courseId'))
+    
+    # Group enrollments by student once instead of rescanning them per student
+    enrollments_by_student: Dict[str, List[str]] = {}
+    for enrollment in enrollments:
+        enrollments_by_student.setdefault(enrollment.get('studentId'), []).append(enrollment.get('courseId'))
     
-    # Count enrollments per course
-    for enrollment in storage_data.get('enrollments', []):
-        course_id = enrollment.get('courseId')
-        if course_id:
-            if course_id not in course_enrollments:
-                course_enrollments[course_id] = []
-            course_enrollments[course_id].append(enrollment.get('studentId'))
+    credits_by_id = {course['id']: course.get('credits', 3) for course in all_courses}
+    
+    return course_enrollments, assignments_by_faculty, enrollments_by_student, credits_by_id
+
+def iter_formatted_courses(storage_data: Dict[str, Any], *,
+                           course_enrollments: Mapping[str, int]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield courses from main application storage in optimization format, one at a time
     
-    # Format courses with enrollment data
+    Args:
+        storage_data: Raw data from main application storage
+        course_enrollments: Enrolled student count per course id
+        
+    Returns:
+        Iterator of formatted course dictionaries
+    """
     for course in storage_data.get('courses', []):
         course_id = course['id']
-        enrolled_students = course_enrollments.get(course_id, [])
+        course_type = course.get('type', 'major')
+        is_lab = course_type == 'lab'
         
-        formatted_course = {
+        yield {
             "id": course_id,
             "code": course.get('code', ''),
             "name": course.get('name', ''),
             "credits": course.get('credits', 3),
-            "course_type": course.get('type', 'major'),
-            "session_type": "lab" if course.get('type') == 'lab' else "theory",
-            "student_strength": len(enrolled_students),
-            "requires_lab": course.get('type') == 'lab',
-            "consecutive_slots_required": 2 if course.get('type') == 'lab' else 1
+            "course_type": course_type,
+            "session_type": "lab" if is_lab else "theory",
+            "student_strength": course_enrollments.get(course_id, 0),
+            "requires_lab": is_lab,
+            "consecutive_slots_required": 2 if is_lab else 1
         }
-        courses.append(formatted_course)
+
+def iter_formatted_faculty(storage_data: Dict[str, Any], *,
+                           assignments_by_faculty: Mapping[str, List[str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield faculty from main application storage in optimization format, one at a time
     
-    # Format faculty with assignments
-    faculty = []
-    for faculty_member in storage_data.get('faculty', []):
-        # Get faculty assignments
-        assignments = [
-            assignment for assignment in storage_data.get('facultyAssignments', [])
-            if assignment.get('facultyId') == faculty_member['id']
-        ]
+    Args:
+        storage_data: Raw data from main application storage
+        assignments_by_faculty: Assigned course ids per faculty id
         
-        specializations = faculty_member.get('specialization', '').split(',')
-        specializations = [spec.strip() for spec in specializations if spec.strip()]
+    Returns:
+        Iterator of formatted faculty dictionaries
+    """
+    for faculty_member in storage_data.get('faculty', []):
+        first_name = faculty_member.get('firstName', '')
+        last_name = faculty_member.get('lastName', '')
         
-        formatted_faculty = {
+        yield {
             "id": faculty_member['id'],
-            "name": f"{faculty_member.get('firstName', '')} {faculty_member.get('lastName', '')}".strip(),
+            "name": f"{first_name} {last_name}".strip(),
             "email": faculty_member.get('email', ''),
-            "specializations": specializations,
+            "specializations": _split_list(faculty_member.get('specialization', '')),
             "max_workload_hours": faculty_member.get('maxWorkloadHours', 12),
-            "preferred_courses": [assignment.get('courseId') for assignment in assignments]
+            "preferred_courses": assignments_by_faculty.get(faculty_member['id'], [])
         }
-        faculty.append(formatted_faculty)
+
+def iter_formatted_rooms(storage_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield rooms from main application storage in optimization format, one at a time
     
-    # Format rooms
-    rooms = []
+    Args:
+        storage_data: Raw data from main application storage
+        
+    Returns:
+        Iterator of formatted room dictionaries
+    """
     for room in storage_data.get('rooms', []):
-        formatted_room = {
+        yield {
             "id": room['id'],
             "name": room.get('name', ''),
             "capacity": room.get('capacity', 30),
             "room_type": room.get('type', 'classroom'),
             "location_block": room.get('building', ''),
-            "equipment": room.get('equipment', '').split(',') if room.get('equipment') else []
+            "equipment": _split_list(room.get('equipment') or '')
         }
-        rooms.append(formatted_room)
+
+def iter_formatted_students(storage_data: Dict[str, Any], *,
+                            enrollments_by_student: Mapping[str, List[str]],
+                            credits_by_id: Mapping[str, int]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield students from main application storage in optimization format, one at a time
     
-    # Format students
-    students = []
-    for student in storage_data.get('students', []):
-        # Get student enrollments
-        student_enrollments = [
-            enrollment.get('courseId') for enrollment in storage_data.get('enrollments', [])
-            if enrollment.get('studentId') == student['id']
-        ]
+    Args:
+        storage_data: Raw data from main application storage
+        enrollments_by_student: Enrolled course ids per student id
+        credits_by_id: Credits per course id
         
-        # Calculate total credits
-        total_credits = 0
-        for course_id in student_enrollments:
-            course = next((c for c in storage_data.get('courses', []) if c['id'] == course_id), None)
-            if course:
-                total_credits += course.get('credits', 3)
+    Returns:
+        Iterator of formatted student dictionaries
+    """
+    for student in storage_data.get('students', []):
+        student_enrollments = enrollments_by_student.get(student['id'], [])
         
-        formatted_student = {
+        yield {
             "id": student['id'],
             "program_id": student.get('programId', ''),
             "semester": student.get('semester', 1),
             "enrolled_courses": student_enrollments,
-            "total_credits": total_credits
+            # Enrollments in unknown courses count for nothing
+            "total_credits": sum(credits_by_id.get(course_id, 0) for course_id in student_enrollments)
         }
-        students.append(formatted_student)
-    
-    # Default configuration
-    config = {
-        "slot_duration_minutes": 50,
-        "college_start_time": "08:30",
-        "college_end_time": "17:30",
-        "slots_per_day": 8,
-        "lunch_duration_minutes": 60
-    }
+
+def extract_from_storage(storage_data: Dict[str, Any]) -> FormattedStorage:
+    """
+    Extract and format data from main application storage for AI optimization
+    
+    Callers that only walk the records once can use the iter_formatted_* generators
+    instead, which never hold a whole formatted list in memory. When the result is
+    fed straight to convert_from_main_app_format, use storage_to_optimization_request.
+    
+    Args:
+        storage_data: Raw data from main application storage
+        
+    Returns:
+        Formatted data ready for AI optimization
+    """
+    course_enrollments, assignments_by_faculty, enrollments_by_student, credits_by_id = _storage_indexes(storage_data)
+    
+    courses = list(iter_formatted_courses(storage_data, course_enrollments=course_enrollments))
+    faculty = list(iter_formatted_faculty(storage_data, assignments_by_faculty=assignments_by_faculty))
+    rooms = list(iter_formatted_rooms(storage_data))
+    students = list(iter_formatted_students(
+        storage_data, enrollments_by_student=enrollments_by_student, credits_by_id=credits_by_id
+    ))
     
     return {
-        "config": config,
+        "config": dict(_DEFAULT_CONFIG),
         "courses": courses,
         "faculty": faculty,
         "rooms": rooms,
         "students": students,
         "objectives": ["minimize_conflicts", "balance_workload"],
         "constraints": {}
-    }
\ No newline at end of file
+    }
+
+def storage_to_optimization_request(storage_data: Dict[str, Any]) -> OptimizationRequest:
+    """
+    Build an optimization request straight from main application storage
+    
+    Equivalent to convert_from_main_app_format(extract_from_storage(storage_data)), but
+    creates the models directly instead of going through the intermediate dictionaries.
+    This is the recommended path when the formatted dictionaries themselves are not needed.
+    
+    Args:
+        storage_data: Raw data from main application storage
+        
+    Returns:
+        OptimizationRequest object for AI engine
+    """
+    course_enrollments, assignments_by_faculty, enrollments_by_student, credits_by_id = _storage_indexes(storage_data)
+    course_types = _COURSE_TYPES
+    
+    courses = [
+        CourseData(
+            id=course['id'],
+            code=course.get('code', ''),
+            name=course.get('name', ''),
+            credits=course.get('credits', 3),
+            course_type=course_types.get(ctype) or CourseType(ctype),
+            session_type=SessionType.LAB if is_lab else SessionType.THEORY,
+            student_strength=course_enrollments.get(course['id'], 0),
+            requires_lab=is_lab,
+            consecutive_slots_required=2 if is_lab else 1
+        )
+        for course in storage_data.get('courses', [])
+        for ctype in [course.get('type', 'major')]
+        for is_lab in [ctype == 'lab']
+    ]
+    
+    faculty = [
+        FacultyData(
+            id=faculty_member['id'],
+            name=f"{faculty_member.get('firstName', '')} {faculty_member.get('lastName', '')}".strip(),
+            email=faculty_member.get('email', ''),
+            specializations=_split_list(faculty_member.get('specialization', '')),
+            max_workload_hours=faculty_member.get('maxWorkloadHours', 12),
+            preferred_courses=assignments_by_faculty.get(faculty_member['id'], [])
+        )
+        for faculty_member in storage_data.get('faculty', [])
+    ]
+    
+    rooms = [
+        RoomData(
+            id=room['id'],
+            name=room.get('name', ''),
+            capacity=room.get('capacity', 30),
+            room_type=room.get('type', 'classroom'),
+            location_block=room.get('building', ''),
+            equipment=_split_list(room.get('equipment') or '')
+        )
+        for room in storage_data.get('rooms', [])
+    ]
+    
+    students = [
+        StudentData(
+            id=student['id'],
+            program_id=student.get('programId', ''),
+            semester=student.get('semester', 1),
+            enrolled_courses=student_enrollments,
+            total_credits=sum(credits_by_id.get(course_id, 0) for course_id in student_enrollments)
+        )
+        for student in storage_data.get('students', [])
+        for student_enrollments in [enrollments_by_student.get(student['id'], [])]
+    ]
+    
+    return OptimizationRequest(
+        config=TimetableConfig(),
+        courses=courses,
+        faculty=faculty,
+        rooms=rooms,
+        students=students,
+        objectives=[OptimizationObjective.MINIMIZE_CONFLICTS, OptimizationObjective.BALANCE_WORKLOAD],
+        constraints={}
+    )
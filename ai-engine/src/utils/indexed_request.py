@@ -0,0 +1,85 @@
+"""
+Per-request lookup indexes shared by the optimizers
+"""
+import re
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from ..models import CourseData, FacultyData, OptimizationRequest, RoomData
+
+_WORD = re.compile(r"\w+")
+
+def _words(text: str) -> List[str]:
+    """Lowercased words of a course name or specialization"""
+    return _WORD.findall(text.lower())
+
+def _specialization_matches(specialization: List[str], course_name: List[str]) -> bool:
+    """Every word of the specialization starts some word of the course name"""
+    return bool(specialization) and all(
+        any(word.startswith(prefix) for word in course_name) for prefix in specialization
+    )
+
+def qualification_matrix(courses: Sequence[CourseData], faculty: Sequence[FacultyData]) -> np.ndarray:
+    """
+    qualified[c, f] is True when some specialization of faculty f matches course c's name
+    
+    This is the single definition of "qualified", used for validation, candidate selection and
+    the ILP qualification cost. Matching is by lowercased word prefix: "math" qualifies for
+    "Mathematics" and "Discrete Math", "physic" for "Physics", but "math" not for "Aftermath".
+    """
+    # Tokenize every name and specialization once instead of per (course, faculty) pair
+    course_words = [_words(course.name) for course in courses]
+    qualified = np.zeros((len(courses), len(faculty)), dtype=bool)
+    for f, member in enumerate(faculty):
+        specs = [_words(spec) for spec in member.specializations]
+        for c, name in enumerate(course_words):
+            qualified[c, f] = any(_specialization_matches(spec, name) for spec in specs)
+    return qualified
+
+def resource_checks(credits: np.ndarray, max_workloads: np.ndarray, capacities: np.ndarray,
+                    strengths: np.ndarray) -> Tuple[int, int, np.ndarray]:
+    """
+    Numeric feasibility checks shared by the optimizers' validation
+    
+    Returns:
+        (total course hours, total faculty hours, indices of courses no room can seat)
+    """
+    largest_room = capacities.max() if capacities.size else -1
+    return int(credits.sum()), int(max_workloads.sum()), np.flatnonzero(strengths > largest_room)
+
+class IndexedRequest:
+    """Id->index maps and struct-of-arrays views of an OptimizationRequest, built once per run"""
+
+    def __init__(self, request: OptimizationRequest):
+        self.request = request
+
+        # id -> position in the request lists
+        self.courses_by_id: Dict[str, int] = {course.id: i for i, course in enumerate(request.courses)}
+        self.faculty_by_id: Dict[str, int] = {faculty.id: i for i, faculty in enumerate(request.faculty)}
+        self.rooms_by_id: Dict[str, int] = {room.id: i for i, room in enumerate(request.rooms)}
+
+        # Struct-of-arrays numeric columns
+        self.credits = np.fromiter((c.credits for c in request.courses), dtype=np.int32, count=len(request.courses))
+        self.student_strength = np.fromiter((c.student_strength for c in request.courses), dtype=np.int32,
+                                            count=len(request.courses))
+        self.course_type_code = np.fromiter((c.course_type_code for c in request.courses), dtype=np.int8,
+                                            count=len(request.courses))
+        self.max_workload = np.fromiter((f.max_workload_hours for f in request.faculty), dtype=np.int32,
+                                        count=len(request.faculty))
+        self.capacity = np.fromiter((r.capacity for r in request.rooms), dtype=np.int32, count=len(request.rooms))
+        self.resources = resource_checks(self.credits, self.max_workload, self.capacity, self.student_strength)
+
+        # room_fits[c, r] is True when room r can seat course c
+        self.room_fits = self.capacity[np.newaxis, :] >= self.student_strength[:, np.newaxis]
+        self.suitable_rooms: Dict[str, List[RoomData]] = {
+            course.id: [request.rooms[r] for r in np.flatnonzero(self.room_fits[c])]
+            for c, course in enumerate(request.courses)
+        }
+
+        # qualified[c, f] is True when faculty f specializes in course c (see qualification_matrix)
+        self.qualified = qualification_matrix(request.courses, request.faculty)
+        
+        # Faculty whose specializations match the course name (may be empty)
+        self.qualified_faculty: Dict[str, List[FacultyData]] = {
+            course.id: [request.faculty[f] for f in np.flatnonzero(self.qualified[c])]
+            for c, course in enumerate(request.courses)
+        }
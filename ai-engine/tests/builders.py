@@ -0,0 +1,41 @@
+"""
+Request builders shared by the optimizer tests
+"""
+from typing import List, Sequence
+from src.models import (
+    CourseData, FacultyData, OptimizationRequest, RoomData, TimetableConfig
+)
+
+def make_course(course_id: str, name: str, credits: int = 2, student_strength: int = 30) -> CourseData:
+    return CourseData(
+        id=course_id,
+        code=course_id.upper(),
+        name=name,
+        credits=credits,
+        course_type="major",
+        session_type="theory",
+        student_strength=student_strength
+    )
+
+def make_faculty(faculty_id: str, specializations: List[str], max_workload_hours: int = 12) -> FacultyData:
+    return FacultyData(
+        id=faculty_id,
+        name=faculty_id.upper(),
+        email=f"{faculty_id}@example.edu",
+        specializations=specializations,
+        max_workload_hours=max_workload_hours
+    )
+
+def make_room(room_id: str, capacity: int = 40) -> RoomData:
+    return RoomData(id=room_id, name=room_id.upper(), capacity=capacity, room_type="classroom", location_block="A")
+
+def make_request(courses: Sequence[CourseData], faculty: Sequence[FacultyData],
+                 rooms: Sequence[RoomData]) -> OptimizationRequest:
+    return OptimizationRequest(
+        config=TimetableConfig(),
+        courses=list(courses),
+        faculty=list(faculty),
+        rooms=list(rooms),
+        students=[],
+        objectives=["minimize_conflicts"]
+    )
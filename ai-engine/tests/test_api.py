@@ -0,0 +1,58 @@
+"""
+Tests for the API's static responses, job queue limit and error handling
+"""
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from src import api
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+JSON = {"content-type": "application/json"}
+
+@pytest.fixture
+def client():
+    # No context manager: the lifespan's queue workers are not needed here
+    return TestClient(api.app, raise_server_exceptions=False)
+
+def request_body() -> str:
+    return make_request([make_course("c0", "Mathematics")], [make_faculty("f0", ["mathematics"])],
+                        [make_room("r0")]).model_dump_json()
+
+@pytest.mark.parametrize("path", ["/", "/algorithms", "/config/default"])
+def test_static_endpoints_answer_304_for_a_matching_etag(client, path):
+    response = client.get(path)
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert (cached.status_code, cached.content, cached.headers["etag"]) == (304, b"", etag)
+    assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+def test_algorithms_lists_the_public_algorithms(client):
+    assert client.get("/algorithms").json()["algorithms"] == ["csp", "genetic", "ilp"]
+
+def test_async_optimize_rejects_jobs_when_the_queue_is_full(client, monkeypatch):
+    full_queue = asyncio.Queue(maxsize=1)
+    full_queue.put_nowait(None)
+    monkeypatch.setattr(api, "job_queue", full_queue)
+
+    response = client.post("/optimize/async", content=request_body(), headers=JSON)
+
+    assert response.status_code == 429
+    assert full_queue.qsize() == 1
+
+def test_unexpected_errors_are_reported_as_500_with_a_message(client, monkeypatch):
+    def fail(request):
+        raise RuntimeError("validator exploded")
+    monkeypatch.setattr(api, "validate_cached", fail)
+
+    response = client.post("/validate", content=request_body(), headers=JSON)
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": {"message": "Internal error", "error": "validator exploded"}}
+
+def test_http_exceptions_pass_through_the_error_handler(client):
+    response = client.get("/optimize/status/missing")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": {"message": "Job missing not found"}}
@@ -0,0 +1,87 @@
+"""
+Tests for the CP-SAT optimizer's decomposition into independent components
+"""
+import time
+from collections import Counter
+import pytest
+from src.optimization import csp_optimizer
+from src.models import TimetableSlot
+from src.optimization.csp_optimizer import CSPOptimizer
+from src.utils.indexed_request import IndexedRequest
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+def two_component_request():
+    """Math courses can only go to f0 and physics courses only to f1"""
+    return make_request(
+        [make_course(f"c{i}", ["Mathematics", "Physics"][i % 2], credits=2) for i in range(4)],
+        [make_faculty("f0", ["mathematics"]), make_faculty("f1", ["physics"])],
+        [make_room("r0")]
+    )
+
+def assert_complete_timetable(request, result):
+    assert result.success, result.message
+    sessions = Counter(slot.course_id for slot in result.timetable_slots)
+    assert sessions == {course.id: course.credits for course in request.courses}
+    assigned = {(slot.course_id, slot.faculty_id) for slot in result.timetable_slots}
+    assert assigned == {("c0", "f0"), ("c1", "f1"), ("c2", "f0"), ("c3", "f1")}
+    assert result.workload_distribution == {"f0": 4, "f1": 4}
+
+def test_components_split_courses_by_shared_faculty():
+    request = two_component_request()
+    optimizer = CSPOptimizer()
+    optimizer.indexed = IndexedRequest(request)
+
+    components = sorted((courses.tolist(), faculty.tolist()) for courses, faculty in optimizer._components(request))
+
+    assert components == [([0, 2], [0]), ([1, 3], [1])]
+
+def test_decomposed_solve_without_hint():
+    request = two_component_request()
+
+    assert_complete_timetable(request, CSPOptimizer().optimize(request))
+
+def test_decomposed_solve_with_hint():
+    request = two_component_request()
+    periods = request.config.slot_indices()
+    hint = [
+        TimetableSlot.from_index(slot_index, periods, course_id=course_id, faculty_id=faculty_id,
+                                 room_id="r0", student_groups=[course_id])
+        for course_id, faculty_id, slot_indices in (("c0", "f0", (0, 1)), ("c1", "f1", (2, 3)))
+        for slot_index in slot_indices
+    ]
+
+    assert_complete_timetable(request, CSPOptimizer().optimize(request, hint=hint))
+
+def test_decomposed_solve_skips_hint_faculty_from_another_component():
+    request = two_component_request()
+    periods = request.config.slot_indices()
+    # c0 is in f0's component; f1 is not part of its sub-request
+    hint = [
+        TimetableSlot.from_index(slot_index, periods, course_id="c0", faculty_id="f1",
+                                 room_id="r0", student_groups=["c0"])
+        for slot_index in (0, 1)
+    ]
+
+    assert_complete_timetable(request, CSPOptimizer().optimize(request, hint=hint))
+
+def test_undecomposed_solve_matches_assignment():
+    request = two_component_request()
+
+    assert_complete_timetable(request, CSPOptimizer(decompose=False).optimize(request))
+
+def test_in_process_components_split_the_remaining_time_by_course_count(monkeypatch):
+    request = make_request(
+        [make_course(f"c{i}", ["Mathematics", "Physics", "Physics", "Physics"][i]) for i in range(4)],
+        [make_faculty("f0", ["mathematics"]), make_faculty("f1", ["physics"])],
+        [make_room("r0")]
+    )
+    budgets = []
+    monkeypatch.setattr(csp_optimizer, "_solve_component",
+                        lambda sub_request, deadline, hint, workers: budgets.append(deadline - time.monotonic()) or [])
+    optimizer = CSPOptimizer()
+    optimizer.indexed = IndexedRequest(request)
+
+    optimizer._solve_components(request, optimizer._components(request), time.monotonic() + 40.0, None)
+
+    # One math course then three physics courses: a quarter of the time, then everything left
+    assert budgets == [pytest.approx(10.0, abs=0.5), pytest.approx(40.0, abs=0.5)]
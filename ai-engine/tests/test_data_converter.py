@@ -0,0 +1,95 @@
+"""
+Tests for the conversions between main application storage, requests and results
+"""
+import json
+from src.models import OptimizationResult, TimetableSlot
+from src.utils.data_converter import (
+    _storage_indexes, convert_from_main_app_format, convert_to_main_app_bytes, convert_to_main_app_format,
+    extract_from_storage, iter_formatted_courses, iter_formatted_faculty, iter_formatted_rooms,
+    iter_formatted_students, storage_to_optimization_request
+)
+
+def make_storage():
+    return {
+        "courses": [
+            {"id": "c0", "code": "MA101", "name": "Mathematics", "credits": 4, "type": "major"},
+            {"id": "c1", "code": "PH101", "name": "Physics", "type": "minor"},
+        ],
+        "faculty": [
+            {"id": "f0", "firstName": "Ada", "lastName": "Lovelace", "email": "ada@example.edu",
+             "specialization": " mathematics ,physics, ", "maxWorkloadHours": 10},
+            {"id": "f1", "firstName": "Max", "email": "max@example.edu"},
+        ],
+        "rooms": [
+            {"id": "r0", "name": "A-1", "capacity": 60, "type": "classroom", "building": "A",
+             "equipment": "projector, whiteboard"},
+            {"id": "r1", "name": "Lab", "equipment": None},
+        ],
+        "students": [
+            {"id": "s0", "programId": "p0", "semester": 2},
+            {"id": "s1"},
+        ],
+        "enrollments": [
+            {"studentId": "s0", "courseId": "c0"},
+            {"studentId": "s0", "courseId": "c1"},
+            {"studentId": "s1", "courseId": "c0"},
+            {"studentId": "s1", "courseId": "retired"},
+        ],
+        "facultyAssignments": [{"facultyId": "f0", "courseId": "c0"}, {"facultyId": "f0", "courseId": "c1"}],
+    }
+
+def test_storage_to_optimization_request_matches_the_two_step_conversion():
+    storage = make_storage()
+
+    assert storage_to_optimization_request(storage) == convert_from_main_app_format(extract_from_storage(storage))
+
+def test_iter_formatted_records_read_storage_fields():
+    storage = make_storage()
+    course_enrollments, assignments_by_faculty, enrollments_by_student, credits_by_id = _storage_indexes(storage)
+
+    courses = list(iter_formatted_courses(storage, course_enrollments=course_enrollments))
+    faculty = list(iter_formatted_faculty(storage, assignments_by_faculty=assignments_by_faculty))
+    rooms = list(iter_formatted_rooms(storage))
+    students = list(iter_formatted_students(storage, enrollments_by_student=enrollments_by_student,
+                                            credits_by_id=credits_by_id))
+
+    assert [(c["student_strength"], c["credits"]) for c in courses] == [(2, 4), (1, 3)]
+    assert faculty[0]["specializations"] == ["mathematics", "physics"]
+    assert faculty[0]["preferred_courses"] == ["c0", "c1"]
+    assert (faculty[1]["name"], faculty[1]["specializations"], faculty[1]["max_workload_hours"]) == ("Max", [], 12)
+    assert [room["equipment"] for room in rooms] == [["projector", "whiteboard"], []]
+    # Enrollments in unknown courses count no credits
+    assert [student["total_credits"] for student in students] == [7, 4]
+
+    formatted = extract_from_storage(storage)
+    assert (formatted["courses"], formatted["faculty"], formatted["rooms"], formatted["students"]) == \
+        (courses, faculty, rooms, students)
+
+def test_result_conversion_to_dict_and_bytes_agree():
+    slot = TimetableSlot(day="Monday", time_start="08:30", time_end="09:20", course_id="c0",
+                         faculty_id="f0", room_id="r0", student_groups=["c0"], slot_index=0)
+    result = OptimizationResult(
+        success=True,
+        message="done",
+        timetable_slots=[slot, slot],
+        conflicts=[{"type": "room_conflict", "entity_id": "r0", "time_key": ("Monday", "08:30"),
+                    "affected_slots": [0, 1], "severity": "high"}],
+        optimization_score=90.0,
+        execution_time_seconds=1.5,
+        algorithm_used="CSP-OR-Tools",
+        workload_distribution={"f0": 2}
+    )
+
+    formatted = convert_to_main_app_format(result)
+
+    assert formatted["timetable_entries"][0] == {
+        "day": "Monday", "time_start": "08:30", "time_end": "09:20", "course_id": "c0",
+        "faculty_id": "f0", "room_id": "r0", "student_groups": ["c0"]
+    }
+    assert formatted["conflicts"] == [{
+        "type": "room_conflict",
+        "description": "Room r0 assigned to multiple classes at Monday_08:30",
+        "affected_entities": [0, 1],
+        "severity": "high"
+    }]
+    assert json.loads(convert_to_main_app_bytes(result)) == formatted
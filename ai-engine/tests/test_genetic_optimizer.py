@@ -0,0 +1,73 @@
+"""
+Tests for the vectorized genetic fitness kernel
+"""
+import numpy as np
+import pytest
+from src.optimization.genetic_optimizer import GeneticOptimizer, evaluate_population, workload_balance
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+# Two periods a day, two faculty, two rooms: 10 weekly slots, so 3 sessions use
+# 3 / (2 rooms * 10 slots) = 0.15 of the rooms
+SLOTS_PER_DAY, N_FACULTY, N_ROOMS = 2, 2, 2
+ROOM_UTILIZATION_BONUS = 0.15 * 10
+
+# Faculty loads of 2 and 1: mean 1.5, variance 0.25, balance 1 - 0.25 / 1.5**2 = 8/9
+UNEVEN_BALANCE_BONUS = 20 * 8 / 9
+
+# Rows are (day, period, course, faculty, room)
+POPULATION = np.array([
+    # Faculty 0 teaches courses 0 and 1 at Monday period 0 in different rooms: 1 conflict
+    [[0, 0, 0, 0, 0],
+     [0, 0, 1, 0, 1],
+     [1, 1, 1, 1, 1]],
+    # No shared (time, faculty) or (time, room): no conflicts
+    [[0, 0, 0, 0, 0],
+     [0, 1, 1, 1, 0],
+     [1, 0, 1, 1, 1]],
+    # Everything at Monday period 0 with faculty 0 in room 0: 2 faculty + 2 room conflicts
+    [[0, 0, 0, 0, 0],
+     [0, 0, 1, 0, 0],
+     [0, 0, 1, 0, 0]],
+], dtype=np.int32)
+
+def test_evaluate_population_matches_hand_computed_fitness():
+    fitness = evaluate_population(POPULATION, SLOTS_PER_DAY, N_FACULTY, N_ROOMS, preference_bonus=0.0)
+
+    expected = [
+        100 - 1 * 10 + UNEVEN_BALANCE_BONUS + ROOM_UTILIZATION_BONUS,
+        100 - 0 * 10 + UNEVEN_BALANCE_BONUS + ROOM_UTILIZATION_BONUS,
+        # A single teaching faculty member counts as perfectly balanced
+        100 - 4 * 10 + 20 * 1.0 + ROOM_UTILIZATION_BONUS,
+    ]
+    assert fitness == pytest.approx(expected)
+
+def test_evaluate_population_adds_preference_bonus():
+    base = evaluate_population(POPULATION, SLOTS_PER_DAY, N_FACULTY, N_ROOMS, preference_bonus=0.0)
+    with_bonus = evaluate_population(POPULATION, SLOTS_PER_DAY, N_FACULTY, N_ROOMS, preference_bonus=0.4)
+
+    assert with_bonus - base == pytest.approx([2.0, 2.0, 2.0])
+
+def test_evaluate_population_never_goes_negative():
+    # 12 sessions of one faculty member in one room at the same time: 11 + 11 conflicts
+    population = np.zeros((1, 12, 5), dtype=np.int32)
+
+    assert evaluate_population(population, SLOTS_PER_DAY, N_FACULTY, N_ROOMS, preference_bonus=0.0)[0] == 0.0
+
+def test_workload_balance_ignores_idle_faculty():
+    workloads = np.array([
+        [2, 2, 0],  # Equal loads among teaching faculty
+        [0, 0, 0],  # Nobody teaches
+        [3, 0, 0],  # One teaching faculty member
+        [2, 1, 0],
+    ])
+
+    assert workload_balance(workloads) == pytest.approx([1.0, 0.0, 1.0, 8 / 9])
+
+def test_validation_uses_the_shared_qualification_rule():
+    request = make_request(
+        [make_course("c0", "Mathematics"), make_course("c1", "Biology")],
+        [make_faculty("f0", ["math"])],
+        [make_room("r0")]
+    )
+
+    assert GeneticOptimizer().validate_constraints(request) == ["No qualified faculty for course C1"]
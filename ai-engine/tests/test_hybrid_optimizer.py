@@ -0,0 +1,78 @@
+"""
+Tests for the hybrid optimizer's choice between the genetic and CP-SAT timetables
+"""
+from typing import Any, Dict, List
+from src.models import OptimizationResult, TimetableSlot
+from src.optimization.hybrid_optimizer import HybridOptimizer
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+class FixedOptimizer:
+    """Stands in for a phase of the hybrid and returns a prepared result"""
+
+    def __init__(self, result: OptimizationResult):
+        self.result = result
+        self.hints: List[Any] = []
+
+    def optimize(self, request, indexed=None, deadline=None, hint=None) -> OptimizationResult:
+        self.hints.append(hint)
+        return self.result
+
+def make_result(name: str, success: bool = True, conflicts: int = 0, score: float = 100.0) -> OptimizationResult:
+    slot = TimetableSlot(day="Monday", time_start="08:30", time_end="09:20", course_id="c0",
+                         faculty_id="f0", room_id="r0", student_groups=["c0"], slot_index=0)
+    conflict: Dict[str, Any] = {"type": "faculty_conflict", "entity_id": "f0", "time_key": ("Monday", "08:30")}
+    return OptimizationResult(
+        success=success,
+        message=name,
+        timetable_slots=[slot] if success else [],
+        conflicts=[conflict] * conflicts,
+        optimization_score=score,
+        execution_time_seconds=0.0,
+        algorithm_used=name
+    )
+
+def run_hybrid(genetic_result: OptimizationResult, csp_result: OptimizationResult) -> OptimizationResult:
+    request = make_request([make_course("c0", "Mathematics")], [make_faculty("f0", ["mathematics"])],
+                           [make_room("r0")])
+    optimizer = HybridOptimizer()
+    optimizer.genetic = FixedOptimizer(genetic_result)
+    optimizer.csp = FixedOptimizer(csp_result)
+    result = optimizer.optimize(request)
+    assert result.algorithm_used == optimizer.name
+    return result
+
+def test_hybrid_keeps_genetic_result_when_polishing_adds_conflicts():
+    result = run_hybrid(make_result("genetic", conflicts=0, score=90.0), make_result("csp", conflicts=1, score=95.0))
+
+    assert result.message == "genetic"
+
+def test_hybrid_takes_csp_result_with_fewer_conflicts():
+    result = run_hybrid(make_result("genetic", conflicts=2), make_result("csp", conflicts=0))
+
+    assert result.message == "csp"
+
+def test_hybrid_breaks_conflict_ties_by_score():
+    assert run_hybrid(make_result("genetic", score=80.0), make_result("csp", score=90.0)).message == "csp"
+    assert run_hybrid(make_result("genetic", score=95.0), make_result("csp", score=90.0)).message == "genetic"
+
+def test_hybrid_falls_back_to_the_successful_phase():
+    assert run_hybrid(make_result("genetic"), make_result("csp", success=False)).message == "genetic"
+    assert run_hybrid(make_result("genetic", success=False), make_result("csp")).message == "csp"
+
+def test_hybrid_reports_csp_failure_when_both_phases_fail():
+    result = run_hybrid(make_result("genetic", success=False), make_result("csp", success=False))
+
+    assert not result.success
+    assert result.message == "csp"
+
+def test_hybrid_hints_csp_with_successful_genetic_timetable():
+    request = make_request([make_course("c0", "Mathematics")], [make_faculty("f0", ["mathematics"])],
+                           [make_room("r0")])
+    genetic_result = make_result("genetic")
+    optimizer = HybridOptimizer()
+    optimizer.genetic = FixedOptimizer(genetic_result)
+    optimizer.csp = FixedOptimizer(make_result("csp"))
+
+    optimizer.optimize(request)
+
+    assert optimizer.csp.hints == [genetic_result.timetable_slots]
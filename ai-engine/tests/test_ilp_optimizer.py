@@ -0,0 +1,84 @@
+"""
+Tests for the ILP optimizer's backend selection, model reuse and warm starts
+"""
+import pytest
+from src.models import TimetableSlot
+from src.optimization import ilp_optimizer
+from src.optimization.ilp_optimizer import ILPOptimizer
+from src.utils.indexed_request import IndexedRequest
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+def small_request(**config):
+    request = make_request([make_course("c0", "Mathematics")], [make_faculty("f0", ["mathematics"])],
+                           [make_room("r0")])
+    return request.model_copy(update={"config": request.config.model_copy(update=config)})
+
+def test_validation_rejects_an_unavailable_solver_name():
+    violations = ILPOptimizer().validate_constraints(small_request(solver_name="NO_SUCH_SOLVER"))
+
+    assert [v for v in violations if "NO_SUCH_SOLVER" in v]
+
+def test_warm_start_falls_back_to_a_backend_that_accepts_a_mip_start(monkeypatch):
+    monkeypatch.setattr(ilp_optimizer, "available_solvers", lambda: ("HiGHS", "PULP_CBC_CMD"))
+
+    optimizer = ILPOptimizer()
+    assert optimizer._make_solver(small_request(), None).name == "HiGHS"
+    assert optimizer._make_solver(small_request(), None, warm_start=True).name == "PULP_CBC_CMD"
+
+def test_warm_start_without_a_mip_start_backend_uses_any_backend(monkeypatch):
+    monkeypatch.setattr(ilp_optimizer, "available_solvers", lambda: ("HiGHS",))
+
+    assert ILPOptimizer()._make_solver(small_request(), None, warm_start=True).name == "HiGHS"
+
+def test_no_available_backend_raises_a_clear_error(monkeypatch):
+    monkeypatch.setattr(ilp_optimizer, "available_solvers", lambda: ())
+
+    with pytest.raises(RuntimeError, match="No MILP backend available"):
+        ILPOptimizer()._make_solver(small_request(), None)
+
+def test_result_message_names_the_backend_used():
+    result = ILPOptimizer().optimize(small_request(solver_name="PULP_CBC_CMD"))
+
+    assert result.success, result.message
+    assert result.message == "Optimal solution found with PULP_CBC_CMD"
+
+def test_identical_request_reuses_the_model_and_warm_starts_from_the_last_solve():
+    request = small_request(solver_name="PULP_CBC_CMD")
+    optimizer = ILPOptimizer()
+    assert optimizer.optimize(request).success
+    problem = optimizer.problem
+
+    assert optimizer.optimize(request).success
+    assert optimizer.problem is problem
+    assert optimizer._set_initial_values(request, None)
+
+    changed = request.model_copy(update={"courses": [request.courses[0].model_copy(update={"credits": 3})]})
+    assert optimizer.optimize(changed).success
+    assert optimizer.problem is not problem
+
+def test_hint_is_relabeled_to_satisfy_symmetry_rows():
+    # Interchangeable faculty and rooms: the symmetry rows want f0/r0 used at least as much as f1/r1
+    request = make_request([make_course("c0", "Mathematics")],
+                           [make_faculty("f0", ["mathematics"]), make_faculty("f1", ["mathematics"])],
+                           [make_room("r0"), make_room("r1")])
+    periods = request.config.slot_indices()
+    hint = [
+        TimetableSlot.from_index(slot_index, periods, course_id="c0", faculty_id="f1", room_id="r1",
+                                 student_groups=["c0"])
+        for slot_index in (0, 1)
+    ]
+    optimizer = ILPOptimizer()
+    optimizer.indexed = IndexedRequest(request)
+    optimizer._create_problem(request)
+    optimizer._add_variables(request)
+    optimizer._add_constraints(request)
+
+    assert optimizer._set_initial_values(request, hint)
+
+    # Every row over schedule variables alone holds at the MIP start
+    rows = {name: row for name, row in optimizer.problem.constraints.items() if "Workload" not in name}
+    assert any("Symmetry" in name for name in rows)
+    assert all(row.valid() for row in rows.values())
+    schedule = optimizer.variables["schedule"]
+    assert schedule["c0", 0, 0, "f0", "r0"].varValue == 1
+    assert schedule["c0", 0, 1, "f0", "r0"].varValue == 1
@@ -0,0 +1,76 @@
+"""
+Tests for the shared request indexes
+"""
+import numpy as np
+from src.utils.indexed_request import IndexedRequest, qualification_matrix
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+def test_qualification_matrix_matches_word_prefixes_case_insensitively():
+    courses = [
+        make_course("c0", "Discrete Math"),
+        make_course("c1", "Aftermath Studies"),
+        make_course("c2", "Quantum Physics Lab"),
+    ]
+    faculty = [
+        make_faculty("f0", ["MATH"]),
+        make_faculty("f1", ["physics"]),
+        make_faculty("f2", ["chemistry"]),
+    ]
+
+    expected = np.array([
+        [True, False, False],
+        [False, False, False],  # "math" only ends the word "aftermath"
+        [False, True, False],
+    ])
+    np.testing.assert_array_equal(qualification_matrix(courses, faculty), expected)
+
+def test_qualification_matrix_accepts_specialization_prefix_of_course_word():
+    courses = [make_course("c0", "Mathematics"), make_course("c1", "Physics II")]
+    faculty = [make_faculty("f0", ["math"]), make_faculty("f1", ["physic"])]
+
+    expected = np.array([
+        [True, False],
+        [False, True],
+    ])
+    np.testing.assert_array_equal(qualification_matrix(courses, faculty), expected)
+
+def test_qualification_matrix_needs_every_word_of_one_specialization():
+    courses = [make_course("c0", "Applied Machine Learning"), make_course("c1", "Machine Design")]
+    faculty = [
+        make_faculty("f0", ["machine learning"]),
+        make_faculty("f1", ["deep learning", "design"]),
+    ]
+
+    expected = np.array([
+        [True, False],
+        [False, True],
+    ])
+    np.testing.assert_array_equal(qualification_matrix(courses, faculty), expected)
+
+def test_qualification_matrix_ignores_blank_specializations():
+    courses = [make_course("c0", "Mathematics")]
+    faculty = [make_faculty("f0", ["", "  ", "-"]), make_faculty("f1", [])]
+
+    np.testing.assert_array_equal(qualification_matrix(courses, faculty), np.array([[False, False]]))
+
+def test_indexed_request_qualified_faculty_follows_matrix():
+    request = make_request(
+        [make_course("c0", "Linear Algebra"), make_course("c1", "Organic Chemistry")],
+        [make_faculty("f0", ["algebra"]), make_faculty("f1", ["chemistry", "algebra"])],
+        [make_room("r0")]
+    )
+    indexed = IndexedRequest(request)
+
+    assert [f.id for f in indexed.qualified_faculty["c0"]] == ["f0", "f1"]
+    assert [f.id for f in indexed.qualified_faculty["c1"]] == ["f1"]
+
+def test_indexed_request_resources_sum_hours_and_flag_unseatable_courses():
+    request = make_request(
+        [make_course("c0", "Algebra", credits=3, student_strength=30),
+         make_course("c1", "Chemistry", credits=2, student_strength=90)],
+        [make_faculty("f0", ["algebra"], max_workload_hours=4), make_faculty("f1", ["chemistry"])],
+        [make_room("r0", capacity=40), make_room("r1", capacity=60)]
+    )
+    course_hours, faculty_hours, unseatable = IndexedRequest(request).resources
+
+    assert (course_hours, faculty_hours, unseatable.tolist()) == (5, 16, [1])
@@ -0,0 +1,22 @@
+"""
+Tests for request model validation
+"""
+import pytest
+from pydantic import ValidationError
+from src.models import TimetableConfig
+
+def test_break_slots_accept_dicts_and_tuples():
+    config = TimetableConfig(break_slots=[
+        {"day": "Monday", "start": "12:00", "end": "13:00"},
+        ("Tuesday", "12:00", "13:00"),
+    ])
+
+    assert config.break_slots == (("Monday", "12:00", "13:00"), ("Tuesday", "12:00", "13:00"))
+
+@pytest.mark.parametrize("break_slots, message", [
+    (None, "must be a list"),
+    ([{"day": "Monday", "start": "12:00"}], "missing end"),
+])
+def test_break_slots_reject_malformed_input_as_validation_errors(break_slots, message):
+    with pytest.raises(ValidationError, match=message):
+        TimetableConfig(break_slots=break_slots)
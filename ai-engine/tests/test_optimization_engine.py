@@ -0,0 +1,46 @@
+"""
+Tests for running several algorithms through the engine's worker pools
+"""
+from dataclasses import replace
+from src import optimization_engine
+from src.optimization.csp_optimizer import CSPOptimizer
+from src.optimization.hybrid_optimizer import HybridOptimizer
+from src.optimization_engine import OptimizationEngine
+from tests.builders import make_course, make_faculty, make_request, make_room
+
+def small_request():
+    return make_request([make_course("c0", "Mathematics")], [make_faculty("f0", ["mathematics"])],
+                        [make_room("r0")])
+
+def test_comparisons_reuse_the_engine_pool():
+    engine = OptimizationEngine()
+    try:
+        first = engine.optimize_with_multiple_algorithms(small_request())
+        pool = engine._pool
+        second = engine.optimize_with_multiple_algorithms(small_request())
+
+        assert list(first) == list(second) == engine.get_available_algorithms()
+        assert engine._pool is pool
+    finally:
+        engine.shutdown()
+    assert engine._pool is None
+
+def test_first_success_stops_at_a_successful_result_without_touching_the_shared_pool():
+    engine = OptimizationEngine()
+    try:
+        results = engine.optimize_with_multiple_algorithms(small_request(), first_success=True)
+
+        assert any(result.success for result in results.values())
+        assert engine._pool is None
+    finally:
+        engine.shutdown()
+
+def test_ga_warm_start_is_a_csp_setting_not_an_algorithm(monkeypatch):
+    assert OptimizationEngine().optimizers['csp'] is CSPOptimizer
+
+    monkeypatch.setattr(optimization_engine, "settings", replace(optimization_engine.settings, CSP_GA_WARM_START=True))
+    engine = OptimizationEngine()
+
+    assert engine.optimizers['csp'] is HybridOptimizer
+    assert engine.get_available_algorithms() == ['csp', 'genetic', 'ilp']
+    assert engine.optimize(small_request(), 'csp').success